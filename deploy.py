@@ -10,18 +10,60 @@ This script handles the complete deployment process for the Pantheon Legends pac
 5. Git tagging
 """
 
+import argparse
+import glob
+import hashlib
+import importlib.util
+import io
+import json
+import re
+import shlex
+import shutil
 import subprocess
 import sys
 import os
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Set, Tuple
+
+# One deployment step: (name, function, steps that must succeed first, interactive)
+Step = Tuple[str, Callable[[], bool], Sequence[str], bool]
+
+# Cached result of validate_environment, reused for a day per interpreter
+ENV_CACHE_FILE = Path.home() / ".cache" / "pantheon-deploy" / "env.json"
+ENV_CACHE_MAX_AGE_SEC = 24 * 60 * 60
+
+# Files that determine the built distributions, and where their hash is recorded
+BUILD_INPUTS = ("pyproject.toml", "README.md", "LICENSE")
+BUILD_HASH_FILE = Path("dist") / ".build-hash"
+
+# Smoke tests run in a single interpreter rather than one process per check
+SMOKE_TESTS = """
+import runpy
+import sys
+import legends
+print('Package import: OK')
+runpy.run_path('test_enhanced_framework.py', run_name='__main__')
+runpy.run_path('test_consensus.py', run_name='__main__')
+sys.exit(0 if legends.test_installation() else 1)
+"""
+
+def _argv(cmd):
+    """Split a command string into an argument list; lists pass through unchanged."""
+    return shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
 
 def run_command(cmd, description):
-    """Run a command and handle errors."""
+    """Run a command (argument list or plain string, no shell) and handle errors."""
+    argv = _argv(cmd)
     print(f"\n🔧 {description}")
-    print(f"   Command: {cmd}")
+    print(f"   Command: {shlex.join(argv)}")
     
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(argv, check=True, capture_output=True, text=True)
         if result.stdout:
             print(f"   Output: {result.stdout.strip()}")
         return True
@@ -33,6 +75,76 @@ def run_command(cmd, description):
             print(f"   Stderr: {e.stderr}")
         return False
 
+def stream_command(cmd, description):
+    """Run a command (no shell), passing its combined output through as it is produced."""
+    argv = _argv(cmd)
+    print(f"\n🔧 {description}")
+    print(f"   Command: {shlex.join(argv)}")
+    sys.stdout.flush()
+    
+    with subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as proc:
+        for line in proc.stdout:
+            sys.stdout.buffer.write(line)
+        sys.stdout.buffer.flush()
+        returncode = proc.wait()
+    
+    if returncode != 0:
+        print(f"   ❌ Error: command exited with status {returncode}")
+        return False
+    return True
+
+def _env_cache_key():
+    """Identify the interpreter an environment check applies to."""
+    return {"python_exe": sys.executable, "python_version": list(sys.version_info[:3])}
+
+def _load_env_cache():
+    """Return True if a still-valid environment check is cached for this interpreter."""
+    try:
+        cached = json.loads(ENV_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    
+    checked_at = cached.get("checked_at", 0)
+    if cached.get("key") != _env_cache_key():
+        return False
+    if time.time() - checked_at > ENV_CACHE_MAX_AGE_SEC:
+        return False
+    # Project changes (e.g. new build requirements) invalidate the check
+    return Path("pyproject.toml").stat().st_mtime <= checked_at
+
+def _save_env_cache():
+    """Record a passed environment check; failures to write are not fatal."""
+    from importlib.metadata import PackageNotFoundError, version
+    
+    entry = {"key": _env_cache_key(), "checked_at": time.time()}
+    for tool in ("build", "twine"):
+        try:
+            entry[f"{tool}_version"] = version(tool)
+        except PackageNotFoundError:
+            entry[f"{tool}_version"] = None
+    
+    try:
+        ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        ENV_CACHE_FILE.write_text(json.dumps(entry, indent=2))
+    except OSError:
+        pass
+
+def upload_with_twine(repository_name, description):
+    """Upload dist/* through twine's Python API instead of a twine subprocess."""
+    print(f"\n🔧 {description}")
+    print(f"   Repository: {repository_name}")
+    
+    # Imported lazily: twine may only have been installed by validate_environment()
+    from twine.commands.upload import upload
+    from twine.settings import Settings
+    
+    try:
+        upload(Settings(repository_name=repository_name), glob.glob("dist/*"))
+        return True
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+        return False
+
 def validate_environment():
     """Validate that deployment environment is ready."""
     print("🛡️ Validating deployment environment...")
@@ -42,24 +154,24 @@ def validate_environment():
         print("❌ pyproject.toml not found. Are you in the project root?")
         return False
     
-    # Check if build tools are available
-    try:
-        subprocess.run([sys.executable, "-m", "build", "--help"], 
-                      capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if _load_env_cache():
+        print("♻️  Using cached environment check")
+        print("✅ Environment validation passed")
+        return True
+    
+    # Check if build tools are importable (no interpreter launch needed)
+    if importlib.util.find_spec("build") is None:
         print("❌ build package not found. Installing...")
-        if not run_command(f"{sys.executable} -m pip install build", "Installing build tools"):
+        if not run_command([sys.executable, "-m", "pip", "install", "build"], "Installing build tools"):
             return False
     
-    # Check if twine is available
-    try:
-        subprocess.run([sys.executable, "-m", "twine", "--help"], 
-                      capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if twine is importable
+    if importlib.util.find_spec("twine") is None:
         print("❌ twine package not found. Installing...")
-        if not run_command(f"{sys.executable} -m pip install twine", "Installing twine"):
+        if not run_command([sys.executable, "-m", "pip", "install", "twine"], "Installing twine"):
             return False
     
+    _save_env_cache()
     print("✅ Environment validation passed")
     return True
 
@@ -67,40 +179,48 @@ def run_tests():
     """Run comprehensive tests."""
     print("\n🧪 Running comprehensive tests...")
     
-    # Test package import
-    if not run_command(f"{sys.executable} -c \"import legends; print('Package import: OK')\"", 
-                      "Testing package import"):
-        return False
-    
-    # Test enhanced framework
-    if not run_command(f"{sys.executable} test_enhanced_framework.py", 
-                      "Testing enhanced framework"):
-        return False
-    
-    # Test consensus analysis
-    if not run_command(f"{sys.executable} test_consensus.py", 
-                      "Testing consensus analysis"):
-        return False
-    
-    # Test installation
-    if not run_command(f"{sys.executable} -c \"import legends; legends.test_installation()\"", 
-                      "Testing installation"):
+    if not run_command([sys.executable, "-c", SMOKE_TESTS],
+                      "Testing package import, framework, consensus and installation"):
         return False
     
     print("✅ All tests passed")
     return True
 
+def compute_build_hash():
+    """Hash the package sources and metadata that go into dist/."""
+    paths = [Path(name) for name in BUILD_INPUTS if Path(name).exists()]
+    paths += sorted(Path("legends").rglob("*.py"))
+    
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def build_is_current():
+    """Return True if dist/ was built from the current sources."""
+    try:
+        return BUILD_HASH_FILE.read_text().strip() == compute_build_hash()
+    except OSError:
+        return False
+
 def clean_build():
     """Clean previous build artifacts."""
     print("\n🧹 Cleaning previous builds...")
     
-    dirs_to_clean = ["build", "dist", "*.egg-info"]
-    for dir_pattern in dirs_to_clean:
-        if run_command(f"rm -rf {dir_pattern}", f"Cleaning {dir_pattern}"):
+    if build_is_current():
+        print("♻️  dist/ matches source hash, keeping existing build")
+        return True
+    
+    for path in [Path("build"), Path("dist"), *Path(".").glob("*.egg-info")]:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.exists():
+            path.unlink()
+        else:
             continue
-        # Try Windows version
-        run_command(f"rmdir /s /q {dir_pattern} 2>nul || del /q /s {dir_pattern} 2>nul || echo OK", 
-                   f"Cleaning {dir_pattern} (Windows)")
+        print(f"   🗑️  Removed {path}")
     
     print("✅ Build cleanup completed")
     return True
@@ -109,19 +229,25 @@ def build_package():
     """Build the package."""
     print("\n📦 Building package...")
     
-    if not run_command(f"{sys.executable} -m build", "Building wheel and source distribution"):
+    if build_is_current():
+        print("♻️  dist/ matches source hash, skipping build")
+        return True
+    
+    if not run_command([sys.executable, "-m", "build"], "Building wheel and source distribution"):
         return False
     
     # Verify build output
-    dist_files = list(Path("dist").glob("*"))
+    with os.scandir("dist") as it:
+        dist_files = [entry for entry in it if entry.is_file() and not entry.name.startswith(".")]
     if len(dist_files) < 2:
         print("❌ Expected both wheel and source distribution")
         return False
     
     print("✅ Package built successfully")
-    for file in dist_files:
-        print(f"   📄 {file}")
+    for entry in dist_files:
+        print(f"   📄 {entry.path}")
     
+    BUILD_HASH_FILE.write_text(compute_build_hash())
     return True
 
 def validate_package():
@@ -129,106 +255,299 @@ def validate_package():
     print("\n🔍 Validating package...")
     
     # Check package with twine
-    if not run_command(f"{sys.executable} -m twine check dist/*", "Validating package with twine"):
+    # No shell, so expand the dist/* glob here
+    twine_check = [sys.executable, "-m", "twine", "check", *sorted(glob.glob("dist/*"))]
+    if not stream_command(twine_check, "Validating package with twine"):
         return False
     
     print("✅ Package validation passed")
     return True
 
-def deploy_to_test_pypi():
+def confirm(question, options):
+    """Answer a y/N gate: --yes accepts it, a non-interactive stdin declines it."""
+    if options.yes:
+        print(f"   {question} (y/N): y [--yes]")
+        return True
+    if not sys.stdin.isatty():
+        print(f"   {question} (y/N): N [no terminal, pass --yes to accept]")
+        return False
+    return input(f"   {question} (y/N): ").lower() == 'y'
+
+def deploy_to_test_pypi(options):
     """Deploy to Test PyPI first."""
     print("\n🚀 Deploying to Test PyPI...")
     
-    test_pypi_cmd = f"{sys.executable} -m twine upload --repository testpypi dist/*"
+    if options.skip_test_pypi:
+        print("   ⏭️  Skipping Test PyPI upload (--skip-test-pypi)")
+        return True
     
     print("   ⚠️  You'll need Test PyPI credentials")
     print("   📝 Create account at: https://test.pypi.org/account/register/")
     print("   🔑 Configure credentials with: python -m twine configure")
     
-    if input("   Continue with Test PyPI upload? (y/N): ").lower() != 'y':
+    if not confirm("Continue with Test PyPI upload?", options):
         print("   ⏭️  Skipping Test PyPI upload")
         return True
     
-    return run_command(test_pypi_cmd, "Uploading to Test PyPI")
+    return upload_with_twine("testpypi", "Uploading to Test PyPI")
 
-def deploy_to_pypi():
+def deploy_to_pypi(options):
     """Deploy to production PyPI."""
     print("\n🚀 Deploying to Production PyPI...")
     
-    pypi_cmd = f"{sys.executable} -m twine upload dist/*"
+    if options.skip_prod:
+        print("   ⏭️  Skipping Production PyPI upload (--skip-prod)")
+        return True
     
     print("   ⚠️  This will publish to PRODUCTION PyPI!")
     print("   🔑 You'll need PyPI credentials")
     
-    if input("   Continue with Production PyPI upload? (y/N): ").lower() != 'y':
+    if not confirm("Continue with Production PyPI upload?", options):
         print("   ⏭️  Skipping Production PyPI upload")
         return True
     
-    return run_command(pypi_cmd, "Uploading to Production PyPI")
+    return upload_with_twine("pypi", "Uploading to Production PyPI")
+
+def read_project_version():
+    """Read the release version from pyproject.toml without importing the package."""
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        match = re.search(r'^version\s*=\s*"([^"]+)"', Path("pyproject.toml").read_text(), re.M)
+        return match.group(1) if match else None
+    
+    with open("pyproject.toml", "rb") as f:
+        return tomllib.load(f).get("project", {}).get("version")
 
-def create_git_tag():
+def create_git_tag(options):
     """Create and push git tag for release."""
     print("\n🏷️  Creating git tag...")
     
-    # Get version from package
-    try:
-        result = subprocess.run([sys.executable, "-c", "import legends; print(legends.__version__)"], 
-                              capture_output=True, text=True, check=True)
-        version = result.stdout.strip()
-    except:
+    version = read_project_version()
+    if not version:
         print("❌ Could not determine package version")
         return False
     
     tag_name = f"v{version}"
     
-    # Check if tag already exists
-    result = subprocess.run(["git", "tag", "-l", tag_name], capture_output=True, text=True)
-    if tag_name in result.stdout:
+    # Check if tag already exists (exact ref match, unlike a substring test on `git tag -l`)
+    tag_exists = subprocess.run(
+        ["git", "rev-parse", "-q", "--verify", f"refs/tags/{tag_name}"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    ).returncode == 0
+    if tag_exists:
         print(f"   ⚠️  Tag {tag_name} already exists")
         return True
     
     # Create tag
-    if not run_command(f"git tag -a {tag_name} -m 'Release {version}'", f"Creating tag {tag_name}"):
+    if not run_command(["git", "tag", "-a", tag_name, "-m", f"Release {version}"],
+                       f"Creating tag {tag_name}"):
         return False
     
     # Push tag
-    if input(f"   Push tag {tag_name} to remote? (y/N): ").lower() == 'y':
-        return run_command(f"git push origin {tag_name}", f"Pushing tag {tag_name}")
+    if options.push_tag and confirm(f"Push tag {tag_name} to remote?", options):
+        return run_command(["git", "push", "origin", tag_name], f"Pushing tag {tag_name}")
     
     print(f"   ✅ Tag {tag_name} created locally")
     return True
 
-def main():
-    """Main deployment process."""
-    print("🚀 Pantheon Legends Deployment Script")
-    print("=" * 50)
-    
-    steps = [
-        ("Environment Validation", validate_environment),
-        ("Test Suite", run_tests),
-        ("Build Cleanup", clean_build),
-        ("Package Building", build_package),
-        ("Package Validation", validate_package),
-        ("Test PyPI Deployment", deploy_to_test_pypi),
-        ("Production PyPI Deployment", deploy_to_pypi),
-        ("Git Tagging", create_git_tag),
+def parse_args(argv=None):
+    """Parse the command-line gates for the upload and tagging steps."""
+    parser = argparse.ArgumentParser(description="Build, check and publish Pantheon Legends.")
+    parser.add_argument("--yes", action="store_true",
+                        help="accept every confirmation prompt (unattended/CI deploys)")
+    parser.add_argument("--skip-test-pypi", action="store_true",
+                        help="do not upload to Test PyPI")
+    parser.add_argument("--skip-prod", action="store_true",
+                        help="do not upload to production PyPI")
+    parser.add_argument("--no-push-tag", dest="push_tag", action="store_false",
+                        help="create the release tag locally without pushing it")
+    return parser.parse_args(argv)
+
+def deployment_steps(options):
+    """Deployment steps: (name, function, steps that must succeed first, interactive).
+    
+    Independent steps run concurrently; interactive steps may prompt on stdin,
+    so they only start once nothing else is running.
+    """
+    return [
+        ("Environment Validation", validate_environment, (), False),
+        ("Test Suite", run_tests, (), False),
+        ("Build Cleanup", clean_build, (), False),
+        ("Package Building", build_package, ("Environment Validation", "Build Cleanup"), False),
+        ("Package Validation", validate_package, ("Package Building",), False),
+        ("Test PyPI Deployment", partial(deploy_to_test_pypi, options),
+         ("Test Suite", "Package Validation"), True),
+        ("Production PyPI Deployment", partial(deploy_to_pypi, options),
+         ("Test PyPI Deployment",), True),
+        ("Git Tagging", partial(create_git_tag, options), ("Production PyPI Deployment",), True),
     ]
+
+def _banner(title):
+    """Return a step banner as one pre-joined string."""
+    return f"\n{'='*20} {title} {'='*20}\n"
+
+class _StepLocalStdout:
+    """stdout proxy that routes a concurrent step's output into its own buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self, buffer):
+        """Send this thread's output to buffer (None = back to the real stdout)."""
+        self._local.buffer = buffer
+    
+    def __getattr__(self, name):
+        return getattr(getattr(self._local, "buffer", None) or self._stream, name)
+
+class _StepOutput(io.RawIOBase):
+    """A concurrent step's output: held back until go_live(), then passed straight through."""
+    
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+        self._held = io.BytesIO()
+        self._lock = threading.Lock()
+        self.live = False
+    
+    def writable(self):
+        return True
     
-    for step_name, step_func in steps:
-        print(f"\n{'='*20} {step_name} {'='*20}")
-        
-        if not step_func():
-            print(f"\n❌ Deployment failed at: {step_name}")
-            print("   Please fix the issues and try again.")
-            sys.exit(1)
-    
-    print("\n" + "="*50)
-    print("🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!")
-    print("✅ Package built and validated")
-    print("✅ Tests passed")
-    print("✅ Ready for PyPI distribution")
-    print("✅ Git tagged for release")
-    print("\n📦 Your Pantheon Legends package is ready!")
+    def write(self, data):
+        with self._lock:
+            if self.live:
+                self._stream.write(data)
+                self._stream.flush()
+            else:
+                self._held.write(data)
+        return len(data)
+    
+    def go_live(self):
+        """Write out everything held so far and pass later output straight through."""
+        with self._lock:
+            self._stream.write(self._held.getvalue())
+            self._stream.flush()
+            self._held = io.BytesIO()
+            self.live = True
+    
+    def held(self) -> bytes:
+        """Output written while held back (empty once live)."""
+        with self._lock:
+            return self._held.getvalue()
+
+def _run_step(step_func: Callable[[], bool]) -> bool:
+    """Run a step, reporting an exception from it as a failure of that step."""
+    try:
+        return bool(step_func())
+    except Exception as e:
+        sys.stdout.write(f"   ❌ Error: {type(e).__name__}: {e}\n{traceback.format_exc()}")
+        return False
+
+def _run_captured_step(stdout: _StepLocalStdout, output: _StepOutput,
+                       step_func: Callable[[], bool]) -> bool:
+    """Run a concurrent step with its output sent to output."""
+    stdout.capture(io.TextIOWrapper(output, encoding=stdout.encoding,
+                                    errors=stdout.errors, write_through=True))
+    try:
+        return _run_step(step_func)
+    finally:
+        stdout.capture(None)
+
+def run_pipeline(steps: Sequence[Step]) -> Optional[str]:
+    """Run steps as soon as their dependencies pass. Returns the first failed step, if any.
+    
+    While several steps run concurrently, each one's output is held back and
+    written after its banner when it finishes, so steps never interleave. A
+    step left running on its own streams its output as it is produced.
+    """
+    pending: Dict[str, Tuple[Callable[[], bool], Set[str], bool]] = {
+        name: (func, set(deps), interactive) for name, func, deps, interactive in steps
+    }
+    passed: Set[str] = set()
+    running: Dict["Future[bool]", Tuple[str, _StepOutput]] = {}
+    failed_step: Optional[str] = None
+    
+    real_stdout = sys.stdout
+    stdout = _StepLocalStdout(real_stdout)
+    sys.stdout = stdout  # type: ignore[assignment]
+    try:
+        with ThreadPoolExecutor() as executor:
+            while pending or running:
+                if failed_step is None:
+                    ready = [name for name, (_, deps, _) in pending.items() if deps <= passed]
+                    for step_name in ready:
+                        step_func, _, interactive = pending[step_name]
+                        if interactive and running:
+                            continue
+                        del pending[step_name]
+                        if interactive:
+                            sys.stdout.write(_banner(step_name))
+                            if not _run_step(step_func):
+                                failed_step = step_name
+                                break
+                            passed.add(step_name)
+                        else:
+                            output = _StepOutput(real_stdout.buffer)
+                            future = executor.submit(_run_captured_step, stdout, output, step_func)
+                            running[future] = (step_name, output)
+                
+                if not running:
+                    if failed_step is not None or not any(
+                        deps <= passed for _, deps, _ in pending.values()
+                    ):
+                        break
+                    continue
+                
+                if len(running) == 1:
+                    # Nothing left to interleave with: show this step's output as it comes
+                    (step_name, output), = running.values()
+                    if not output.live:
+                        sys.stdout.write(_banner(step_name))
+                        sys.stdout.flush()
+                        output.go_live()
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step_name, output = running.pop(future)
+                    if not output.live:
+                        sys.stdout.write(_banner(step_name))
+                        sys.stdout.flush()
+                        sys.stdout.buffer.write(output.held())
+                        sys.stdout.buffer.flush()
+                    if future.result():
+                        passed.add(step_name)
+                    elif failed_step is None:
+                        failed_step = step_name
+                        if running:
+                            sys.stdout.write("\n⏳ Waiting for running steps to finish: "
+                                             + ", ".join(name for name, _ in running.values()) + "\n")
+    finally:
+        sys.stdout = real_stdout
+    
+    return failed_step
+
+def main():
+    """Main deployment process."""
+    options = parse_args()
+    
+    sys.stdout.write("🚀 Pantheon Legends Deployment Script\n" + "=" * 50 + "\n")
+    
+    failed_step = run_pipeline(deployment_steps(options))
+    if failed_step:
+        sys.stdout.write(f"\n❌ Deployment failed at: {failed_step}\n"
+                         "   Please fix the issues and try again.\n")
+        sys.exit(1)
+    
+    sys.stdout.writelines([
+        "\n" + "="*50 + "\n",
+        "🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!\n",
+        "✅ Package built and validated\n",
+        "✅ Tests passed\n",
+        "✅ Ready for PyPI distribution\n",
+        "✅ Git tagged for release\n",
+        "\n📦 Your Pantheon Legends package is ready!\n",
+    ])
 
 if __name__ == "__main__":
     main()
@@ -5,27 +5,54 @@ This module demonstrates how to use the legend engines and Pantheon orchestrator
 """
 
 import asyncio
+import sys
+from collections import deque
 from datetime import datetime
 
 from legends import (
     Pantheon,
     LegendRequest,
     LegendProgress,
-    DowLegendEngine
+    DowLegendEngine,
+    ReliabilityLevel
 )
+from legends.contracts import LegendEnvelope, QualityMeta
+
+
+# Progress line template, and lines waiting to be written in batches
+_PROGRESS_FMT = "[%s] %s: %.1f%% - %s\n"
+_progress_lines = deque()
 
 
 async def progress_handler(progress: LegendProgress) -> None:
     """
-    Example progress callback that prints progress updates.
+    Example progress callback that queues progress updates for batched output.
     
     Args:
         progress: Progress update from a legend engine
     """
-    print(f"[{progress.legend}] {progress.stage}: {progress.percent:.1f}% - {progress.note}")
+    _progress_lines.append(
+        _PROGRESS_FMT % (progress.legend, progress.stage, progress.percent, progress.note)
+    )
+
 
+def flush_progress() -> None:
+    """Write all queued progress lines with a single write."""
+    if _progress_lines:
+        batch = "".join(_progress_lines)
+        _progress_lines.clear()
+        sys.stdout.write(batch)
+        sys.stdout.flush()
 
-async def single_engine_example():
+
+async def flush_progress_periodically(interval: float = 0.05) -> None:
+    """Flush queued progress lines every `interval` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        flush_progress()
+
+
+async def single_engine_example(as_of: datetime):
     """Example of running a single legend engine."""
     print("=== Single Engine Example ===")
     
@@ -36,12 +63,13 @@ async def single_engine_example():
     request = LegendRequest(
         symbol="AAPL",
         timeframe="1d",
-        as_of=datetime.now()
+        as_of=as_of
     )
     
     # Run the analysis with progress reporting
     print(f"Running {dow_engine.name} analysis for {request.symbol}...")
     result = await dow_engine.run_async(request, progress_handler)
+    flush_progress()
     
     # Display results
     print(f"\nResults from {result.legend} engine:")
@@ -56,7 +84,7 @@ async def single_engine_example():
         print(f"  {key}: {value}")
 
 
-async def pantheon_orchestrator_example():
+async def pantheon_orchestrator_example(as_of: datetime):
     """Example of using the Pantheon orchestrator with multiple engines."""
     print("\n=== Pantheon Orchestrator Example ===")
     
@@ -69,12 +97,13 @@ async def pantheon_orchestrator_example():
     request = LegendRequest(
         symbol="MSFT",
         timeframe="4h",
-        as_of=datetime.now()
+        as_of=as_of
     )
     
     # Run all engines concurrently
     print(f"\nRunning all engines for {request.symbol}...")
     results = await pantheon.run_all_legends_async(request, progress_handler)
+    flush_progress()
     
     # Display aggregated results
     print(f"\nAggregated Results for {request.symbol}:")
@@ -85,7 +114,7 @@ async def pantheon_orchestrator_example():
         print(f"  Quality Score: {result.quality.data_completeness:.1%}")
 
 
-async def custom_engine_example():
+async def custom_engine_example(as_of: datetime):
     """Example of creating and using a custom legend engine."""
     print("\n=== Custom Engine Example ===")
     
@@ -98,11 +127,8 @@ async def custom_engine_example():
         
         async def run_async(self, request, progress_callback=None):
             """Simple SMA analysis example."""
-            from legends.contracts import LegendEnvelope, QualityMeta
-            
             if progress_callback:
                 await progress_callback(LegendProgress("SMA", "compute", 50.0, "Calculating moving averages"))
-                await asyncio.sleep(0.1)
                 await progress_callback(LegendProgress("SMA", "signal", 100.0, "Generating signals"))
             
             facts = {
@@ -115,7 +141,10 @@ async def custom_engine_example():
             quality = QualityMeta(
                 sample_size=50.0,
                 freshness_sec=30.0,
-                data_completeness=1.0
+                data_completeness=1.0,
+                reliability_level=ReliabilityLevel.EXPERIMENTAL,
+                false_positive_risk=0.4,
+                manipulation_sensitivity=0.5
             )
             
             return LegendEnvelope(
@@ -133,11 +162,12 @@ async def custom_engine_example():
     request = LegendRequest(
         symbol="TSLA",
         timeframe="1h",
-        as_of=datetime.now()
+        as_of=as_of
     )
     
     print("Running custom SMA engine...")
     result = await pantheon.run_legend_async("SMA", request, progress_handler)
+    flush_progress()
     
     print(f"\nCustom Engine Results:")
     print(f"  Engine: {result.legend}")
@@ -147,9 +177,17 @@ async def custom_engine_example():
 
 async def main():
     """Run all examples."""
-    await single_engine_example()
-    await pantheon_orchestrator_example()
-    await custom_engine_example()
+    # One analysis timestamp shared by every example
+    as_of = datetime.now()
+    
+    flusher = asyncio.create_task(flush_progress_periodically())
+    try:
+        await single_engine_example(as_of)
+        await pantheon_orchestrator_example(as_of)
+        await custom_engine_example(as_of)
+    finally:
+        flusher.cancel()
+        flush_progress()
 
 
 if __name__ == "__main__":
@@ -7,28 +7,26 @@ orchestration and provides automatic consensus calculation.
 """
 
 import asyncio
+import sys
 from datetime import datetime
 from legends import (
     Pantheon, AnalysisResult, ConsensusResult,
     LegendRequest, ReliabilityLevel,
-    quick_analysis, consensus_only
+    quick_analysis, consensus_only, testing
 )
 
 
-async def example_unified_analysis():
+async def example_unified_analysis(pantheon: Pantheon, as_of: datetime):
     """Example: One-call analysis with automatic consensus"""
     print("🎯 Example: Unified Analysis with Automatic Consensus")
     print("=" * 55)
     
-    # Create Pantheon instance
-    pantheon = Pantheon.create_default()
-    
     # Single method call - runs engines AND calculates consensus
     result = await pantheon.analyze_with_consensus(
         request=LegendRequest(
             symbol="AAPL",
             timeframe="1D",
-            as_of=datetime.now()
+            as_of=as_of
         ),
         enable_consensus=True
     )
@@ -55,7 +53,7 @@ async def example_unified_analysis():
             print(f"  • {name}: {contrib['signal']} (weight: {contrib['weight_contribution']:.2f})")
 
 
-async def example_convenience_functions():
+async def example_convenience_functions(as_of: datetime):
     """Example: Using convenience functions for quick analysis"""
     print("\n\n⚡ Example: Convenience Functions")
     print("=" * 35)
@@ -65,6 +63,7 @@ async def example_convenience_functions():
     result = await quick_analysis(
         symbol="SPY",
         timeframe="4H",
+        timestamp=as_of,
         with_consensus=True
     )
     
@@ -74,19 +73,19 @@ async def example_convenience_functions():
     print("\n🎯 Consensus-only analysis...")
     consensus = await consensus_only(
         symbol="TSLA",
+        timestamp=as_of,
         min_reliability=ReliabilityLevel.MEDIUM
     )
     
     print(f"TSLA consensus: {consensus.signal.value} ({consensus.confidence:.1%})")
 
 
-async def example_reliability_filtering():
+async def example_reliability_filtering(pantheon: Pantheon, as_of: datetime):
     """Example: Filtering engines by reliability for consensus"""
     print("\n\n🔍 Example: Reliability-Filtered Consensus")
     print("=" * 45)
     
-    pantheon = Pantheon.create_default()
-    request = LegendRequest(symbol="BTCUSD", timeframe="1H", as_of=datetime.now())
+    request = LegendRequest(symbol="BTCUSD", timeframe="1H", as_of=as_of)
     
     # High reliability consensus
     high_rel_result = await pantheon.analyze_with_consensus(
@@ -112,13 +111,12 @@ async def example_reliability_filtering():
         print(f"  Engines: {med_rel_result.consensus.engines_analyzed}")
 
 
-async def example_selective_engines():
+async def example_selective_engines(pantheon: Pantheon, as_of: datetime):
     """Example: Running consensus with specific engines"""
     print("\n\n🎛️ Example: Selective Engine Consensus")
     print("=" * 40)
     
-    pantheon = Pantheon.create_default()
-    request = LegendRequest(symbol="NVDA", timeframe="1D", as_of=datetime.now())
+    request = LegendRequest(symbol="NVDA", timeframe="1D", as_of=as_of)
     
     # Traditional engines only
     traditional_result = await pantheon.analyze_with_consensus(
@@ -144,13 +142,12 @@ async def example_selective_engines():
         print(f"  Confidence: {all_result.consensus.confidence:.1%}")
 
 
-async def example_comparison_old_vs_new():
+async def example_comparison_old_vs_new(pantheon: Pantheon, as_of: datetime):
     """Example: Comparing old manual vs new automatic approach"""
     print("\n\n🔄 Example: Old vs New Approach")
     print("=" * 35)
     
-    pantheon = Pantheon.create_default()
-    request = LegendRequest(symbol="MSFT", timeframe="1D", as_of=datetime.now())
+    request = LegendRequest(symbol="MSFT", timeframe="1D", as_of=as_of)
     
     print("❌ OLD APPROACH (Manual Orchestration):")
     print("   1. results = await pantheon.run_all_legends_async(request)")
@@ -171,20 +168,18 @@ async def example_comparison_old_vs_new():
     print(f"  Quality: {result.consensus.consensus_quality if result.consensus else 'N/A'}")
 
 
-async def example_error_handling():
+async def example_error_handling(pantheon: Pantheon, as_of: datetime):
     """Example: Robust error handling in unified analysis"""
     print("\n\n🛡️ Example: Error Handling")
     print("=" * 28)
     
-    pantheon = Pantheon.create_default()
-    
     # Even if some engines fail, consensus can still work
     try:
         result = await pantheon.analyze_with_consensus(
             request=LegendRequest(
                 symbol="ERROR_TEST",
                 timeframe="1D", 
-                as_of=datetime.now()
+                as_of=as_of
             )
         )
         
@@ -205,13 +200,27 @@ async def main():
     print("🎯 Automatic consensus with NO manual orchestration")
     print("=" * 60)
     
+    # One shared Pantheon instance and analysis timestamp for all examples
+    pantheon = Pantheon.create_default()
+    as_of = datetime.now()
+    
     try:
-        await example_unified_analysis()
-        await example_convenience_functions()
-        await example_reliability_filtering()
-        await example_selective_engines()
-        await example_comparison_old_vs_new()
-        await example_error_handling()
+        # Examples are independent, so run them concurrently and print in order;
+        # a failure is reported right after the failing example's own output
+        buffered = dict(return_exception=True)
+        with testing.task_local_stdout():
+            outcomes = await asyncio.gather(
+                testing.run_buffered(example_unified_analysis, pantheon, as_of, **buffered),
+                testing.run_buffered(example_convenience_functions, as_of, **buffered),
+                testing.run_buffered(example_reliability_filtering, pantheon, as_of, **buffered),
+                testing.run_buffered(example_selective_engines, pantheon, as_of, **buffered),
+                testing.run_buffered(example_comparison_old_vs_new, pantheon, as_of, **buffered),
+                testing.run_buffered(example_error_handling, pantheon, as_of, **buffered),
+            )
+        for output, error in outcomes:
+            sys.stdout.write(output)
+            if error is not None:
+                raise error
         
         print("\n\n🎉 All examples completed successfully!")
         print("\n📋 Key Benefits Demonstrated:")
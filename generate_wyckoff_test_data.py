@@ -5,15 +5,157 @@ Generates deterministic OHLCV test data for Wyckoff Method analysis validation.
 Creates six JSON files with plausible bars, events, and Point & Figure objectives
 that explicitly satisfy strict Wyckoff canon for automated testing.
 
-Run: python generate_wyckoff_test_data.py
+Run: python generate_wyckoff_test_data.py [--pretty]
 """
 
+import argparse
 import json
+import operator
 import pathlib
-from typing import Dict, List, Any, Union
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Tuple, TypedDict
 
+from legends._wyckoff_kernels import (
+    CLIMAX_CLOSE_MISPLACED,
+    CLIMAX_SPREAD_TOO_NARROW,
+    CLIMAX_VOLUME_NOT_CLIMACTIC,
+    buying_climax_failures,
+    close_position,
+    selling_climax_failures,
+)
 
-def create_accumulation_bars() -> List[Dict[str, Union[int, float]]]:
+
+# Fixture shapes. Bars and events match the JSON files; rows are the compact
+# in-module form (open, high, low, close, volume).
+Bar = Dict[str, float]
+BarRow = Tuple[float, float, float, float, int]
+WyckoffEvents = Mapping[str, str]
+
+
+class PointFigure(TypedDict):
+    """Point & Figure objective for a breakout (or breakdown) from the range."""
+    direction: str
+    breakout_level: float
+    boxes: int
+    box_size: float
+    objective: float
+
+
+# Bar fields in column order, with the array typecode each column is stored as.
+# Bar time is implicit (1-based position) and only written out as JSON.
+BAR_COLUMN_TYPES = (
+    ("open", "d"),
+    ("high", "d"),
+    ("low", "d"),
+    ("close", "d"),
+    ("volume", "l"),
+)
+
+
+# Field names matching the positional (open, high, low, close, volume) bar rows
+BAR_FIELDS = tuple(field for field, _ in BAR_COLUMN_TYPES)
+
+
+class BarColumns(NamedTuple):
+    """Bars laid out column-wise: one contiguous array per OHLCV field."""
+    open: "array[float]"
+    high: "array[float]"
+    low: "array[float]"
+    close: "array[float]"
+    volume: "array[int]"
+
+
+# Prices in the quantized column view are integer cents: price * PRICE_SCALE
+PRICE_SCALE = 100
+
+
+class QuantizedBarColumns(NamedTuple):
+    """
+    Column-wise bars with exact integer prices, for downstream detectors.
+    
+    Prices are 32-bit integer cents (divide by PRICE_SCALE for dollars) and
+    volumes are unsigned 32-bit integers.
+    """
+    open: "array[int]"
+    high: "array[int]"
+    low: "array[int]"
+    close: "array[int]"
+    volume: "array[int]"
+
+
+def bars_to_columns(bars: List[Bar]) -> BarColumns:
+    """Transpose a list of bar dicts into per-field arrays."""
+    columns: List["array[Any]"] = [
+        array(typecode, [bar[field] for bar in bars])
+        for field, typecode in BAR_COLUMN_TYPES
+    ]
+    return BarColumns(*columns)
+
+
+def _rows_to_bar_dicts(rows: Tuple[BarRow, ...]) -> List[Bar]:
+    """Materialize positional bar rows as JSON-ready dicts, numbering time from 1."""
+    return [{"time": time, **dict(zip(BAR_FIELDS, row))} for time, row in enumerate(rows, 1)]
+
+
+def _rows_to_quantized_columns(rows: Tuple[BarRow, ...]) -> QuantizedBarColumns:
+    """Transpose positional bar rows into integer-cents price and volume arrays."""
+    opens, highs, lows, closes, volumes = zip(*rows)
+    
+    def cents(prices: Tuple[float, ...]) -> "array[int]":
+        return array("i", [round(price * PRICE_SCALE) for price in prices])
+    
+    return QuantizedBarColumns(cents(opens), cents(highs), cents(lows), cents(closes),
+                               array("I", volumes))
+
+
+def _columns_and_spreads(bars: List[Bar]) -> Tuple[BarColumns, "array[float]"]:
+    """Transpose bars once and compute every bar's high-low spread."""
+    cols = bars_to_columns(bars)
+    return cols, array("d", map(operator.sub, cols.high, cols.low))
+
+
+# Accumulation bars as (open, high, low, close, volume) rows, in time order
+_ACCUMULATION_BARS: Tuple[BarRow, ...] = (
+    # Pre-decline context (bars 1-5)
+    (125.0, 126.0, 123.0, 124.0, 45000),
+    (124.0, 124.5, 120.0, 121.0, 55000),
+    (121.0, 122.0, 117.0, 118.0, 60000),
+    (118.0, 119.0, 115.0, 116.0, 65000),
+    (116.0, 117.0, 112.0, 113.0, 70000),
+    
+    # SC - Selling Climax (bar 6)
+    (113.0, 113.5, 105.0, 107.0, 150000),  # Wide spread down, climactic volume, close off low
+    
+    # AR - Automatic Rally (bar 7)
+    (107.0, 118.0, 106.0, 116.0, 120000),  # Strong bounce up
+    
+    # ST - Secondary Test (bar 8)
+    (116.0, 115.0, 108.0, 109.0, 80000),   # Test SC low, lower volume, narrower spread, close above SC low
+    
+    # Spring (bar 9)
+    (109.0, 110.0, 104.0, 108.0, 90000),   # Brief undercut of support
+    
+    # Test of Spring (bar 10)
+    (108.0, 109.0, 105.0, 107.0, 60000),  # Lower volume test
+    
+    # SOS - Sign of Strength (bar 11)
+    (107.0, 120.0, 106.0, 119.0, 140000), # Break through AR high, increased volume
+    
+    # LPS - Last Point of Support (bar 12)
+    (119.0, 120.0, 115.0, 116.0, 70000),  # Pullback holds above former resistance
+    
+    # Follow-through (bars 13-15)
+    (116.0, 119.0, 115.0, 118.0, 65000),
+    (118.0, 121.0, 117.0, 120.0, 75000),
+    (120.0, 123.0, 119.0, 122.0, 80000),
+)
+
+
+def create_accumulation_bars() -> List[Bar]:
     """
     Create 15-bar accumulation sequence following strict Wyckoff canon.
     
@@ -28,71 +170,87 @@ def create_accumulation_bars() -> List[Dict[str, Union[int, float]]]:
     12: LPS (Last Point of Support) - pullback holds above resistance
     13-15: Follow-through drift up
     """
-    bars = [
-        # Pre-decline context (bars 1-5)
-        {"time": 1, "open": 125.0, "high": 126.0, "low": 123.0, "close": 124.0, "volume": 45000},
-        {"time": 2, "open": 124.0, "high": 124.5, "low": 120.0, "close": 121.0, "volume": 55000},
-        {"time": 3, "open": 121.0, "high": 122.0, "low": 117.0, "close": 118.0, "volume": 60000},
-        {"time": 4, "open": 118.0, "high": 119.0, "low": 115.0, "close": 116.0, "volume": 65000},
-        {"time": 5, "open": 116.0, "high": 117.0, "low": 112.0, "close": 113.0, "volume": 70000},
-        
-        # SC - Selling Climax (bar 6)
-        {"time": 6, "open": 113.0, "high": 113.5, "low": 105.0, "close": 107.0, "volume": 150000},  # Wide spread down, climactic volume, close off low
-        
-        # AR - Automatic Rally (bar 7)
-        {"time": 7, "open": 107.0, "high": 118.0, "low": 106.0, "close": 116.0, "volume": 120000},  # Strong bounce up
-        
-        # ST - Secondary Test (bar 8)
-        {"time": 8, "open": 116.0, "high": 115.0, "low": 108.0, "close": 109.0, "volume": 80000},   # Test SC low, lower volume, narrower spread, close above SC low
-        
-        # Spring (bar 9)
-        {"time": 9, "open": 109.0, "high": 110.0, "low": 104.0, "close": 108.0, "volume": 90000},   # Brief undercut of support
-        
-        # Test of Spring (bar 10)
-        {"time": 10, "open": 108.0, "high": 109.0, "low": 105.0, "close": 107.0, "volume": 60000},  # Lower volume test
-        
-        # SOS - Sign of Strength (bar 11)
-        {"time": 11, "open": 107.0, "high": 120.0, "low": 106.0, "close": 119.0, "volume": 140000}, # Break through AR high, increased volume
-        
-        # LPS - Last Point of Support (bar 12)
-        {"time": 12, "open": 119.0, "high": 120.0, "low": 115.0, "close": 116.0, "volume": 70000},  # Pullback holds above former resistance
-        
-        # Follow-through (bars 13-15)
-        {"time": 13, "open": 116.0, "high": 119.0, "low": 115.0, "close": 118.0, "volume": 65000},
-        {"time": 14, "open": 118.0, "high": 121.0, "low": 117.0, "close": 120.0, "volume": 75000},
-        {"time": 15, "open": 120.0, "high": 123.0, "low": 119.0, "close": 122.0, "volume": 80000},
-    ]
-    return bars
+    return _rows_to_bar_dicts(_ACCUMULATION_BARS)
+
+
+def create_accumulation_bars_soa() -> QuantizedBarColumns:
+    """Accumulation bars as one integer array per field (prices in cents), for column-oriented detectors."""
+    return _rows_to_quantized_columns(_ACCUMULATION_BARS)
+
+
+# Accumulation event labels keyed by 0-based bar index (read-only, shared)
+_ACCUMULATION_EVENTS: Mapping[str, str] = MappingProxyType({
+    "5": "SC",      # Selling Climax at bar 6 (0-indexed: 5)
+    "6": "AR",      # Automatic Rally at bar 7 (0-indexed: 6)
+    "7": "ST",      # Secondary Test at bar 8 (0-indexed: 7)
+    "8": "Spring",  # Spring at bar 9 (0-indexed: 8)
+    "9": "Test",    # Test at bar 10 (0-indexed: 9)
+    "10": "SOS",    # Sign of Strength at bar 11 (0-indexed: 10)
+    "11": "LPS"     # Last Point of Support at bar 12 (0-indexed: 11)
+})
 
 
-def create_accumulation_events() -> Dict[str, str]:
-    """Create event labels for accumulation sequence."""
-    return {
-        "5": "SC",      # Selling Climax at bar 6 (0-indexed: 5)
-        "6": "AR",      # Automatic Rally at bar 7 (0-indexed: 6)
-        "7": "ST",      # Secondary Test at bar 8 (0-indexed: 7)
-        "8": "Spring",  # Spring at bar 9 (0-indexed: 8)
-        "9": "Test",    # Test at bar 10 (0-indexed: 9)
-        "10": "SOS",    # Sign of Strength at bar 11 (0-indexed: 10)
-        "11": "LPS"     # Last Point of Support at bar 12 (0-indexed: 11)
-    }
+def create_accumulation_events() -> WyckoffEvents:
+    """Create event labels for accumulation sequence (a shared, read-only mapping)."""
+    return _ACCUMULATION_EVENTS
 
 
-def create_accumulation_pf() -> Dict[str, Union[str, float, int]]:
+# Point & Figure objective for the accumulation breakout, fixed at import
+_ACCUMULATION_PF: PointFigure = {
+    "direction": "up",
+    "breakout_level": 120.0,   # SOS high
+    "boxes": 8,                # Horizontal count from trading range
+    "box_size": 2.0,           # $2 per box
+    "objective": 136.0         # 120.0 + (8 * 2.0)
+}
+
+
+def create_accumulation_pf() -> PointFigure:
     """
     Create Point & Figure objective for accumulation.
     Breakout at SOS high (120.0), horizontal count ~8 boxes.
     """
-    return {
-        "direction": "up",
-        "breakout_level": 120.0,   # SOS high
-        "boxes": 8,                # Horizontal count from trading range
-        "box_size": 2.0,           # $2 per box
-        "objective": 136.0         # 120.0 + (8 * 2.0)
-    }
+    return _ACCUMULATION_PF.copy()
 
 
-def create_distribution_bars() -> List[Dict[str, Union[int, float]]]:
+# Distribution bars as (open, high, low, close, volume) rows, in time order
+_DISTRIBUTION_BARS: Tuple[BarRow, ...] = (
+    # Pre-advance context (bars 1-5)
+    (85.0, 87.0, 84.0, 86.0, 45000),
+    (86.0, 89.0, 85.0, 88.0, 55000),
+    (88.0, 92.0, 87.0, 91.0, 60000),
+    (91.0, 95.0, 90.0, 94.0, 65000),
+    (94.0, 98.0, 93.0, 97.0, 70000),
+    
+    # BC - Buying Climax (bar 6)
+    (97.0, 108.0, 96.0, 106.0, 150000), # Wide spread up, climactic volume, close off high
+    
+    # AR - Automatic Reaction (bar 7)
+    (106.0, 107.0, 95.0, 97.0, 120000), # Sharp decline
+    
+    # ST - Secondary Test (bar 8)
+    (97.0, 105.0, 96.0, 103.0, 80000),  # Test BC high, lower volume, narrower spread, close below BC high
+    
+    # UT - Upthrust (bar 9)
+    (103.0, 109.0, 102.0, 104.0, 90000), # Thrust above trading range high but fails back in
+    
+    # UTAD - Upthrust After Distribution (bar 10)
+    (104.0, 110.0, 103.0, 105.0, 85000), # Deeper thrust that fails back in
+    
+    # SOW - Sign of Weakness (bar 11)
+    (105.0, 106.0, 92.0, 94.0, 140000), # Break through AR low, increased volume
+    
+    # LPSY - Last Point of Supply (bar 12)
+    (94.0, 99.0, 93.0, 96.0, 70000),   # Weak rally failing below resistance
+    
+    # Follow-through (bars 13-15)
+    (96.0, 97.0, 91.0, 93.0, 75000),
+    (93.0, 94.0, 88.0, 90.0, 80000),
+    (90.0, 91.0, 85.0, 87.0, 85000),
+)
+
+
+def create_distribution_bars() -> List[Bar]:
     """
     Create 15-bar distribution sequence following strict Wyckoff canon.
     
@@ -107,77 +265,67 @@ def create_distribution_bars() -> List[Dict[str, Union[int, float]]]:
     12: LPSY (Last Point of Supply) - weak rally failing below resistance
     13-15: Follow-through drift down
     """
-    bars = [
-        # Pre-advance context (bars 1-5)
-        {"time": 1, "open": 85.0, "high": 87.0, "low": 84.0, "close": 86.0, "volume": 45000},
-        {"time": 2, "open": 86.0, "high": 89.0, "low": 85.0, "close": 88.0, "volume": 55000},
-        {"time": 3, "open": 88.0, "high": 92.0, "low": 87.0, "close": 91.0, "volume": 60000},
-        {"time": 4, "open": 91.0, "high": 95.0, "low": 90.0, "close": 94.0, "volume": 65000},
-        {"time": 5, "open": 94.0, "high": 98.0, "low": 93.0, "close": 97.0, "volume": 70000},
-        
-        # BC - Buying Climax (bar 6)
-        {"time": 6, "open": 97.0, "high": 108.0, "low": 96.0, "close": 106.0, "volume": 150000}, # Wide spread up, climactic volume, close off high
-        
-        # AR - Automatic Reaction (bar 7)
-        {"time": 7, "open": 106.0, "high": 107.0, "low": 95.0, "close": 97.0, "volume": 120000}, # Sharp decline
-        
-        # ST - Secondary Test (bar 8)
-        {"time": 8, "open": 97.0, "high": 105.0, "low": 96.0, "close": 103.0, "volume": 80000},  # Test BC high, lower volume, narrower spread, close below BC high
-        
-        # UT - Upthrust (bar 9)
-        {"time": 9, "open": 103.0, "high": 109.0, "low": 102.0, "close": 104.0, "volume": 90000}, # Thrust above trading range high but fails back in
-        
-        # UTAD - Upthrust After Distribution (bar 10)
-        {"time": 10, "open": 104.0, "high": 110.0, "low": 103.0, "close": 105.0, "volume": 85000}, # Deeper thrust that fails back in
-        
-        # SOW - Sign of Weakness (bar 11)
-        {"time": 11, "open": 105.0, "high": 106.0, "low": 92.0, "close": 94.0, "volume": 140000}, # Break through AR low, increased volume
-        
-        # LPSY - Last Point of Supply (bar 12)
-        {"time": 12, "open": 94.0, "high": 99.0, "low": 93.0, "close": 96.0, "volume": 70000},   # Weak rally failing below resistance
-        
-        # Follow-through (bars 13-15)
-        {"time": 13, "open": 96.0, "high": 97.0, "low": 91.0, "close": 93.0, "volume": 75000},
-        {"time": 14, "open": 93.0, "high": 94.0, "low": 88.0, "close": 90.0, "volume": 80000},
-        {"time": 15, "open": 90.0, "high": 91.0, "low": 85.0, "close": 87.0, "volume": 85000},
-    ]
-    return bars
+    return _rows_to_bar_dicts(_DISTRIBUTION_BARS)
+
 
+def create_distribution_bars_soa() -> QuantizedBarColumns:
+    """Distribution bars as one integer array per field (prices in cents), for column-oriented detectors."""
+    return _rows_to_quantized_columns(_DISTRIBUTION_BARS)
 
-def create_distribution_events() -> Dict[str, str]:
-    """Create event labels for distribution sequence."""
-    return {
-        "5": "BC",      # Buying Climax at bar 6 (0-indexed: 5)
-        "6": "AR",      # Automatic Reaction at bar 7 (0-indexed: 6)
-        "7": "ST",      # Secondary Test at bar 8 (0-indexed: 7)
-        "8": "UT",      # Upthrust at bar 9 (0-indexed: 8)
-        "9": "UTAD",    # Upthrust After Distribution at bar 10 (0-indexed: 9)
-        "10": "SOW",    # Sign of Weakness at bar 11 (0-indexed: 10)
-        "11": "LPSY"    # Last Point of Supply at bar 12 (0-indexed: 11)
-    }
 
+# Distribution event labels keyed by 0-based bar index (read-only, shared)
+_DISTRIBUTION_EVENTS: Mapping[str, str] = MappingProxyType({
+    "5": "BC",      # Buying Climax at bar 6 (0-indexed: 5)
+    "6": "AR",      # Automatic Reaction at bar 7 (0-indexed: 6)
+    "7": "ST",      # Secondary Test at bar 8 (0-indexed: 7)
+    "8": "UT",      # Upthrust at bar 9 (0-indexed: 8)
+    "9": "UTAD",    # Upthrust After Distribution at bar 10 (0-indexed: 9)
+    "10": "SOW",    # Sign of Weakness at bar 11 (0-indexed: 10)
+    "11": "LPSY"    # Last Point of Supply at bar 12 (0-indexed: 11)
+})
 
-def create_distribution_pf() -> Dict[str, Union[str, float, int]]:
+
+def create_distribution_events() -> WyckoffEvents:
+    """Create event labels for distribution sequence (a shared, read-only mapping)."""
+    return _DISTRIBUTION_EVENTS
+
+
+# Point & Figure objective for the distribution breakdown, fixed at import
+_DISTRIBUTION_PF: PointFigure = {
+    "direction": "down",
+    "breakout_level": 92.0,    # SOW low (breakdown level)
+    "boxes": 8,                # Horizontal count from trading range
+    "box_size": 2.0,           # $2 per box
+    "objective": 76.0          # 92.0 - (8 * 2.0)
+}
+
+
+def create_distribution_pf() -> PointFigure:
     """
     Create Point & Figure objective for distribution.
     Breakdown at SOW low (92.0), horizontal count ~8 boxes.
     """
-    return {
-        "direction": "down",
-        "breakout_level": 92.0,    # SOW low (breakdown level)
-        "boxes": 8,                # Horizontal count from trading range
-        "box_size": 2.0,           # $2 per box
-        "objective": 76.0          # 92.0 - (8 * 2.0)
-    }
+    return _DISTRIBUTION_PF.copy()
 
 
-def write_json_file(data: Any, filepath: pathlib.Path) -> None:
-    """Write data to JSON file with pretty formatting."""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+def _json_default(obj: Any) -> Any:
+    """Encode read-only mappings (the shared event constants) as JSON objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
-def validate_accumulation_data(bars: List[Dict], events: Dict[str, str], pf: Dict) -> None:
+def write_json_file(data: Any, filepath: pathlib.Path, pretty: bool = False) -> None:
+    """Write data to JSON file, compact unless pretty formatting is requested."""
+    # Encode the whole document first; json.dump would issue one write per chunk
+    if pretty:
+        text = json.dumps(data, indent=2, default=_json_default)
+    else:
+        text = json.dumps(data, separators=(",", ":"), default=_json_default)
+    filepath.write_text(text)
+
+
+def validate_accumulation_data(bars: List[Bar], events: WyckoffEvents, pf: PointFigure) -> None:
     """Validate accumulation data meets Wyckoff canon requirements."""
     print("🔍 Validating accumulation data...")
     
@@ -186,38 +334,44 @@ def validate_accumulation_data(bars: List[Dict], events: Dict[str, str], pf: Dic
     spring_idx, test_idx = 8, 9
     sos_idx, lps_idx = 10, 11
     
+    # Transpose once so every check below is plain array indexing
+    cols, spreads = _columns_and_spreads(bars)
+    highs, lows, closes, volumes = cols.high, cols.low, cols.close, cols.volume
+    
+    # Pull every value the checks need into locals once
+    sc_low, sc_vol = lows[sc_idx], volumes[sc_idx]
+    ar_high = highs[ar_idx]
+    st_close, st_vol = closes[st_idx], volumes[st_idx]
+    spring_low, spring_vol = lows[spring_idx], volumes[spring_idx]
+    test_vol = volumes[test_idx]
+    sos_high, sos_vol = highs[sos_idx], volumes[sos_idx]
+    lps_low = lows[lps_idx]
+    spread, st_spread = spreads[sc_idx], spreads[st_idx]
+    
     # SC validation: wide spread down, climactic volume, close off low
-    sc_bar = bars[sc_idx]
-    spread = sc_bar["high"] - sc_bar["low"]
-    close_position = (sc_bar["close"] - sc_bar["low"]) / spread
-    assert spread >= 8.0, f"SC spread too narrow: {spread}"
-    assert sc_bar["volume"] >= 140000, f"SC volume not climactic: {sc_bar['volume']}"
-    assert close_position <= 0.3, f"SC close not off low: {close_position}"
+    failures = selling_climax_failures(highs, lows, closes, volumes, sc_idx,
+                                       min_spread=8.0, min_volume=140000, max_close_position=0.3)
+    assert not failures & CLIMAX_SPREAD_TOO_NARROW, f"SC spread too narrow: {spread}"
+    assert not failures & CLIMAX_VOLUME_NOT_CLIMACTIC, f"SC volume not climactic: {sc_vol}"
+    assert not failures & CLIMAX_CLOSE_MISPLACED, f"SC close not off low: {close_position(highs, lows, closes, sc_idx)}"
     
     # ST validation: lower volume than SC, narrower spread, close above SC low
-    st_bar = bars[st_idx]
-    st_spread = st_bar["high"] - st_bar["low"]
-    assert st_bar["volume"] < sc_bar["volume"], f"ST volume not lower than SC: {st_bar['volume']} vs {sc_bar['volume']}"
+    assert st_vol < sc_vol, f"ST volume not lower than SC: {st_vol} vs {sc_vol}"
     assert st_spread < spread, f"ST spread not narrower than SC: {st_spread} vs {spread}"
-    assert st_bar["close"] > sc_bar["low"], f"ST close not above SC low: {st_bar['close']} vs {sc_bar['low']}"
+    assert st_close > sc_low, f"ST close not above SC low: {st_close} vs {sc_low}"
     
     # Spring validation: undercut support
-    spring_bar = bars[spring_idx]
-    assert spring_bar["low"] < sc_bar["low"], f"Spring didn't undercut SC low: {spring_bar['low']} vs {sc_bar['low']}"
+    assert spring_low < sc_low, f"Spring didn't undercut SC low: {spring_low} vs {sc_low}"
     
     # Test validation: lower volume than spring
-    test_bar = bars[test_idx]
-    assert test_bar["volume"] < spring_bar["volume"], f"Test volume not lower: {test_bar['volume']} vs {spring_bar['volume']}"
+    assert test_vol < spring_vol, f"Test volume not lower: {test_vol} vs {spring_vol}"
     
     # SOS validation: break through AR high, increased volume
-    ar_bar = bars[ar_idx]
-    sos_bar = bars[sos_idx]
-    assert sos_bar["high"] > ar_bar["high"], f"SOS didn't break AR high: {sos_bar['high']} vs {ar_bar['high']}"
-    assert sos_bar["volume"] > test_bar["volume"], f"SOS volume not increased: {sos_bar['volume']} vs {test_bar['volume']}"
+    assert sos_high > ar_high, f"SOS didn't break AR high: {sos_high} vs {ar_high}"
+    assert sos_vol > test_vol, f"SOS volume not increased: {sos_vol} vs {test_vol}"
     
     # LPS validation: pullback holds above former resistance
-    lps_bar = bars[lps_idx]
-    assert lps_bar["low"] > ar_bar["high"] * 0.95, f"LPS didn't hold above resistance: {lps_bar['low']} vs {ar_bar['high']}"
+    assert lps_low > ar_high * 0.95, f"LPS didn't hold above resistance: {lps_low} vs {ar_high}"
     
     # P&F validation
     assert pf["direction"] == "up", f"P&F direction wrong: {pf['direction']}"
@@ -227,7 +381,7 @@ def validate_accumulation_data(bars: List[Dict], events: Dict[str, str], pf: Dic
     print("✅ Accumulation data validation passed!")
 
 
-def validate_distribution_data(bars: List[Dict], events: Dict[str, str], pf: Dict) -> None:
+def validate_distribution_data(bars: List[Bar], events: WyckoffEvents, pf: PointFigure) -> None:
     """Validate distribution data meets Wyckoff canon requirements."""
     print("🔍 Validating distribution data...")
     
@@ -236,37 +390,43 @@ def validate_distribution_data(bars: List[Dict], events: Dict[str, str], pf: Dic
     ut_idx, utad_idx = 8, 9
     sow_idx, lpsy_idx = 10, 11
     
+    # Transpose once so every check below is plain array indexing
+    cols, spreads = _columns_and_spreads(bars)
+    highs, lows, closes, volumes = cols.high, cols.low, cols.close, cols.volume
+    
+    # Pull every value the checks need into locals once
+    bc_high, bc_vol = highs[bc_idx], volumes[bc_idx]
+    ar_low = lows[ar_idx]
+    st_high, st_close, st_vol = highs[st_idx], closes[st_idx], volumes[st_idx]
+    ut_high = highs[ut_idx]
+    utad_high, utad_vol = highs[utad_idx], volumes[utad_idx]
+    sow_low, sow_vol = lows[sow_idx], volumes[sow_idx]
+    lpsy_high = highs[lpsy_idx]
+    spread, st_spread = spreads[bc_idx], spreads[st_idx]
+    
     # BC validation: wide spread up, climactic volume, close off high
-    bc_bar = bars[bc_idx]
-    spread = bc_bar["high"] - bc_bar["low"]
-    close_position = (bc_bar["close"] - bc_bar["low"]) / spread
-    assert spread >= 10.0, f"BC spread too narrow: {spread}"
-    assert bc_bar["volume"] >= 140000, f"BC volume not climactic: {bc_bar['volume']}"
-    assert close_position >= 0.7, f"BC close not off high: {close_position}"
+    failures = buying_climax_failures(highs, lows, closes, volumes, bc_idx,
+                                      min_spread=10.0, min_volume=140000, min_close_position=0.7)
+    assert not failures & CLIMAX_SPREAD_TOO_NARROW, f"BC spread too narrow: {spread}"
+    assert not failures & CLIMAX_VOLUME_NOT_CLIMACTIC, f"BC volume not climactic: {bc_vol}"
+    assert not failures & CLIMAX_CLOSE_MISPLACED, f"BC close not off high: {close_position(highs, lows, closes, bc_idx)}"
     
     # ST validation: lower volume than BC, narrower spread, close below BC high
-    st_bar = bars[st_idx]
-    st_spread = st_bar["high"] - st_bar["low"]
-    assert st_bar["volume"] < bc_bar["volume"], f"ST volume not lower than BC: {st_bar['volume']} vs {bc_bar['volume']}"
+    assert st_vol < bc_vol, f"ST volume not lower than BC: {st_vol} vs {bc_vol}"
     assert st_spread < spread, f"ST spread not narrower than BC: {st_spread} vs {spread}"
-    assert st_bar["close"] < bc_bar["high"], f"ST close not below BC high: {st_bar['close']} vs {bc_bar['high']}"
+    assert st_close < bc_high, f"ST close not below BC high: {st_close} vs {bc_high}"
     
     # UT/UTAD validation: thrust above trading range high
-    ut_bar = bars[ut_idx]
-    utad_bar = bars[utad_idx]
-    tr_high = max(bc_bar["high"], st_bar["high"])
-    assert ut_bar["high"] > tr_high, f"UT didn't thrust above TR high: {ut_bar['high']} vs {tr_high}"
-    assert utad_bar["high"] > tr_high, f"UTAD didn't thrust above TR high: {utad_bar['high']} vs {tr_high}"
+    tr_high = max(bc_high, st_high)
+    assert ut_high > tr_high, f"UT didn't thrust above TR high: {ut_high} vs {tr_high}"
+    assert utad_high > tr_high, f"UTAD didn't thrust above TR high: {utad_high} vs {tr_high}"
     
     # SOW validation: break through AR low, increased volume
-    ar_bar = bars[ar_idx]
-    sow_bar = bars[sow_idx]
-    assert sow_bar["low"] < ar_bar["low"], f"SOW didn't break AR low: {sow_bar['low']} vs {ar_bar['low']}"
-    assert sow_bar["volume"] > utad_bar["volume"], f"SOW volume not increased: {sow_bar['volume']} vs {utad_bar['volume']}"
+    assert sow_low < ar_low, f"SOW didn't break AR low: {sow_low} vs {ar_low}"
+    assert sow_vol > utad_vol, f"SOW volume not increased: {sow_vol} vs {utad_vol}"
     
     # LPSY validation: weak rally failing below resistance
-    lpsy_bar = bars[lpsy_idx]
-    assert lpsy_bar["high"] < ar_bar["low"] * 1.05, f"LPSY rallied too high: {lpsy_bar['high']} vs {ar_bar['low']}"
+    assert lpsy_high < ar_low * 1.05, f"LPSY rallied too high: {lpsy_high} vs {ar_low}"
     
     # P&F validation
     assert pf["direction"] == "down", f"P&F direction wrong: {pf['direction']}"
@@ -276,56 +436,73 @@ def validate_distribution_data(bars: List[Dict], events: Dict[str, str], pf: Dic
     print("✅ Distribution data validation passed!")
 
 
-def main():
+# Output file stem and factory for every generated fixture, in write order
+FIXTURES: List[Tuple[str, Callable[[], Any]]] = [
+    ("accumulation_bars", create_accumulation_bars),
+    ("accumulation_events", create_accumulation_events),
+    ("accumulation_pf", create_accumulation_pf),
+    ("distribution_bars", create_distribution_bars),
+    ("distribution_events", create_distribution_events),
+    ("distribution_pf", create_distribution_pf),
+]
+
+
+def _flush_log(log: List[str]) -> None:
+    """Write the collected progress lines with a single call and clear them."""
+    sys.stdout.write("\n".join(log) + "\n")
+    sys.stdout.flush()
+    log.clear()
+
+
+def main() -> None:
     """Generate all Wyckoff test data files."""
-    print("🎯 Generating Wyckoff Legend Test Data...")
+    parser = argparse.ArgumentParser(description="Generate deterministic Wyckoff test data")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent the JSON output for reading (default: compact)")
+    args = parser.parse_args()
+    
+    # Progress lines are collected and written in one go at each checkpoint
+    log: List[str] = ["🎯 Generating Wyckoff Legend Test Data..."]
     
     # Create output directory
     output_dir = pathlib.Path("wyckoff_test_data")
     output_dir.mkdir(exist_ok=True)
-    print(f"📁 Created directory: {output_dir.absolute()}")
-    
-    # Generate accumulation data
-    print("\n📈 Generating accumulation sequence...")
-    acc_bars = create_accumulation_bars()
-    acc_events = create_accumulation_events()
-    acc_pf = create_accumulation_pf()
-    
-    # Generate distribution data
-    print("📉 Generating distribution sequence...")
-    dist_bars = create_distribution_bars()
-    dist_events = create_distribution_events()
-    dist_pf = create_distribution_pf()
-    
-    # Write all files
-    files = [
-        ("accumulation_bars.json", acc_bars),
-        ("accumulation_events.json", acc_events),
-        ("accumulation_pf.json", acc_pf),
-        ("distribution_bars.json", dist_bars),
-        ("distribution_events.json", dist_events),
-        ("distribution_pf.json", dist_pf),
-    ]
+    log.append(f"📁 Created directory: {output_dir.absolute()}")
+    
+    # Generate every fixture from the manifest
+    log.append("\n📈 Generating accumulation sequence...")
+    log.append("📉 Generating distribution sequence...")
+    fixtures = {name: factory() for name, factory in FIXTURES}
     
-    print("\n💾 Writing JSON files...")
-    for filename, data in files:
-        filepath = output_dir / filename
-        write_json_file(data, filepath)
-        print(f"   ✅ {filepath.absolute()}")
+    log.append("\n💾 Writing JSON files...")
+    paths = [output_dir / f"{name}.json" for name in fixtures]
+    # The writes are independent, so overlap them on a small thread pool
+    with ThreadPoolExecutor(max_workers=len(fixtures)) as executor:
+        write = partial(write_json_file, pretty=args.pretty)
+        list(executor.map(write, fixtures.values(), paths))
+    log.extend(f"   ✅ {filepath.absolute()}" for filepath in paths)
     
-    # Validate data
-    print("\n🔬 Running validation checks...")
+    # Validate data (the validators report their own progress)
+    log.append("\n🔬 Running validation checks...")
+    _flush_log(log)
+    acc_bars, acc_events, acc_pf = (
+        fixtures["accumulation_bars"], fixtures["accumulation_events"], fixtures["accumulation_pf"]
+    )
+    dist_bars, dist_events, dist_pf = (
+        fixtures["distribution_bars"], fixtures["distribution_events"], fixtures["distribution_pf"]
+    )
     validate_accumulation_data(acc_bars, acc_events, acc_pf)
     validate_distribution_data(dist_bars, dist_events, dist_pf)
     
-    print(f"\n✅ Successfully generated {len(files)} Wyckoff test data files!")
-    print(f"📂 Output directory: {output_dir.absolute()}")
+    log.append(f"\n✅ Successfully generated {len(fixtures)} Wyckoff test data files!")
+    log.append(f"📂 Output directory: {output_dir.absolute()}")
     
     # Print summary
-    print("\n📊 Data Summary:")
-    print(f"   Accumulation: {len(acc_bars)} bars, {len(acc_events)} events")
-    print(f"   Distribution: {len(dist_bars)} bars, {len(dist_events)} events")
-    print(f"   P&F Objectives: UP to {acc_pf['objective']}, DOWN to {dist_pf['objective']}")
+    log.append("\n📊 Data Summary:")
+    log.append(f"   Accumulation: {len(acc_bars)} bars, {len(acc_events)} events")
+    log.append(f"   Distribution: {len(dist_bars)} bars, {len(dist_events)} events")
+    log.append(f"   P&F Objectives: UP to {acc_pf['objective']}, DOWN to {dist_pf['objective']}")
+    _flush_log(log)
 
 
 if __name__ == "__main__":
@@ -336,7 +513,8 @@ if __name__ == "__main__":
 USAGE README:
 
 How to run:
-    python generate_wyckoff_test_data.py
+    python generate_wyckoff_test_data.py            # compact JSON
+    python generate_wyckoff_test_data.py --pretty   # indented JSON for reading
 
 What files are produced and how to view them with our existing wyckoff_viz_cli.py:
 
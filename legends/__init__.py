@@ -15,6 +15,9 @@ Key Features:
 Real legend implementations must be created by users of the framework.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from .contracts import (
     LegendRequest,
     LegendProgress,
@@ -23,13 +26,43 @@ from .contracts import (
     ILegendEngine,
     LegendType,
     ReliabilityLevel,
+    LEGEND_TYPE_VALUES,
+    RELIABILITY_VALUES,
     TraditionalLegendBase,
     ScannerEngineBase
 )
-from .engines import DowLegendEngine, WyckoffLegendEngine, VolumeBreakoutScanner
-from .pantheon import Pantheon, AnalysisResult, quick_analysis, consensus_only
-from .consensus import ConsensusAnalyzer, ConsensusResult, ConsensusSignal
-from .scaffold import setup_scanner_as_legend
+
+if TYPE_CHECKING:
+    from .engines import DowLegendEngine, WyckoffLegendEngine, VolumeBreakoutScanner
+    from .pantheon import (
+        Pantheon,
+        AnalysisResult,
+        quick_analysis,
+        consensus_only,
+        get_default_pantheon,
+        clear_default_pantheon_cache
+    )
+    from .consensus import ConsensusAnalyzer, ConsensusResult, ConsensusSignal
+    from .scaffold import setup_scanner_as_legend
+
+# Public names loaded from their submodule on first access (PEP 562), so
+# importing legends for the contracts alone doesn't pull in the engines,
+# orchestrator, consensus and scaffolding modules
+_LAZY_IMPORTS = {
+    "DowLegendEngine": ".engines",
+    "WyckoffLegendEngine": ".engines",
+    "VolumeBreakoutScanner": ".engines",
+    "Pantheon": ".pantheon",
+    "AnalysisResult": ".pantheon",
+    "quick_analysis": ".pantheon",
+    "consensus_only": ".pantheon",
+    "get_default_pantheon": ".pantheon",
+    "clear_default_pantheon_cache": ".pantheon",
+    "ConsensusAnalyzer": ".consensus",
+    "ConsensusResult": ".consensus",
+    "ConsensusSignal": ".consensus",
+    "setup_scanner_as_legend": ".scaffold",
+}
 
 __version__ = "0.4.0"
 __all__ = [
@@ -40,6 +73,8 @@ __all__ = [
     "ILegendEngine",
     "LegendType",
     "ReliabilityLevel",
+    "LEGEND_TYPE_VALUES",
+    "RELIABILITY_VALUES",
     "TraditionalLegendBase", 
     "ScannerEngineBase",
     "DowLegendEngine",
@@ -52,11 +87,27 @@ __all__ = [
     "ConsensusSignal",
     "quick_analysis",
     "consensus_only",
+    "get_default_pantheon",
+    "clear_default_pantheon_cache",
     "test_installation",
     "setup_scanner_as_legend"
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import a lazily-exported name from its submodule and cache it here."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 def test_installation():
     """
     Test if Pantheon Legends is properly installed and working.
@@ -67,6 +118,7 @@ def test_installation():
     try:
         # Test imports
         from datetime import datetime
+        from .pantheon import Pantheon
         
         # Test basic functionality
         pantheon = Pantheon.create_default()
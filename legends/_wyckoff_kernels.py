@@ -0,0 +1,85 @@
+"""
+Column-wise Wyckoff invariant checks.
+
+These are plain functions over per-field sequences (highs, lows, closes,
+volumes) and a bar index, so they work the same on a 15-bar fixture and on a
+long OHLCV series. Each returns a bitmask of the invariants the bar fails;
+0 means every check passed.
+"""
+
+from typing import Sequence, Union
+
+Number = Union[int, float]
+
+# Failure bits shared by the selling and buying climax checks
+CLIMAX_SPREAD_TOO_NARROW = 1
+CLIMAX_VOLUME_NOT_CLIMACTIC = 2
+CLIMAX_CLOSE_MISPLACED = 4
+
+
+def close_position(highs: Sequence[Number], lows: Sequence[Number],
+                   closes: Sequence[Number], idx: int) -> float:
+    """Where the close sits within the bar's range (0.0 = low, 1.0 = high)."""
+    low = lows[idx]
+    spread = highs[idx] - low
+    if spread <= 0:
+        return 0.0
+    return (closes[idx] - low) / spread
+
+
+def selling_climax_failures(
+    highs: Sequence[Number],
+    lows: Sequence[Number],
+    closes: Sequence[Number],
+    volumes: Sequence[Number],
+    idx: int,
+    min_spread: float,
+    min_volume: float,
+    max_close_position: float
+) -> int:
+    """
+    Check the selling climax invariants for the bar at idx.
+
+    A selling climax needs a wide down spread, climactic volume and a close
+    off the low (in the lower part of the range).
+
+    Returns:
+        Bitmask of CLIMAX_* flags for the failed invariants
+    """
+    failures = 0
+    if highs[idx] - lows[idx] < min_spread:
+        failures |= CLIMAX_SPREAD_TOO_NARROW
+    if volumes[idx] < min_volume:
+        failures |= CLIMAX_VOLUME_NOT_CLIMACTIC
+    if close_position(highs, lows, closes, idx) > max_close_position:
+        failures |= CLIMAX_CLOSE_MISPLACED
+    return failures
+
+
+def buying_climax_failures(
+    highs: Sequence[Number],
+    lows: Sequence[Number],
+    closes: Sequence[Number],
+    volumes: Sequence[Number],
+    idx: int,
+    min_spread: float,
+    min_volume: float,
+    min_close_position: float
+) -> int:
+    """
+    Check the buying climax invariants for the bar at idx.
+
+    A buying climax needs a wide up spread, climactic volume and a close
+    off the high (in the upper part of the range).
+
+    Returns:
+        Bitmask of CLIMAX_* flags for the failed invariants
+    """
+    failures = 0
+    if highs[idx] - lows[idx] < min_spread:
+        failures |= CLIMAX_SPREAD_TOO_NARROW
+    if volumes[idx] < min_volume:
+        failures |= CLIMAX_VOLUME_NOT_CLIMACTIC
+    if close_position(highs, lows, closes, idx) < min_close_position:
+        failures |= CLIMAX_CLOSE_MISPLACED
+    return failures
@@ -42,6 +42,11 @@ class ReliabilityLevel(Enum):
     EXPERIMENTAL = "experimental"
 
 
+# String values of each enum, in declaration order
+LEGEND_TYPE_VALUES = tuple(t.value for t in LegendType)
+RELIABILITY_VALUES = tuple(r.value for r in ReliabilityLevel)
+
+
 # --- Data Transfer Objects ---
 
 @dataclass(frozen=True)
@@ -28,7 +28,49 @@ from .contracts import (
 )
 
 
-class DowLegendEngine(TraditionalLegendBase):
+# Static sample facts for the demo engines. Each run copies these, so callers
+# can still mutate the facts of the envelope they receive.
+# The Dow facts are split by the stage that reports them.
+_DOW_SAMPLE_TREND: Dict[str, Any] = {
+    "primary_trend": "bullish",
+    "secondary_trend": "neutral",
+    "trend_strength": 0.65,
+}
+
+_DOW_SAMPLE_VOLUME_CONFIRMATION = True
+
+_DOW_ANALYSIS_NOTE = "DEMO DATA - Not real Dow Theory analysis"
+
+_VOLUME_BREAKOUT_SAMPLE_FACTS: Dict[str, Any] = {
+    "volume_spike_detected": True,
+    "volume_ratio": 2.3,  # 2.3x normal volume
+    "breakout_direction": "upward",
+    "price_confirmation": True,
+    "scan_timestamp": None,  # Filled in per scan
+    "analysis_note": "DEMO DATA - Not real volume scanning"
+}
+
+
+class _SimulatedLatencyMixin:
+    """Optional per-stage demo latency shared by the demo engines."""
+
+    def __init__(self, simulate_latency: bool = False):
+        """
+        Initialize the engine.
+        
+        Args:
+            simulate_latency: Pause between stages to mimic a real engine's
+                runtime (demo only; off by default so runs finish immediately)
+        """
+        self.simulate_latency = simulate_latency
+
+    async def _simulate_work(self, seconds: float) -> None:
+        """Sleep for a stage's demo latency when simulate_latency is enabled."""
+        if self.simulate_latency:
+            await asyncio.sleep(seconds)
+
+
+class DowLegendEngine(_SimulatedLatencyMixin, TraditionalLegendBase):
     """
     Demo implementation showing the structure for a Dow Theory legend engine.
     
@@ -70,30 +112,19 @@ class DowLegendEngine(TraditionalLegendBase):
             
         **WARNING**: This returns sample data for demonstration purposes only.
         """
-        # Report progress stages
         await self._report_progress("initialization", 0.0, "Starting Dow Theory analysis", progress_callback)
-        await asyncio.sleep(0.1)  # Simulate work
-        
-        await self._report_progress("trend_analysis", 25.0, "Identifying primary trends", progress_callback)
-        await asyncio.sleep(0.2)
-        
-        await self._report_progress("volume_confirmation", 50.0, "Analyzing volume patterns", progress_callback)
-        await asyncio.sleep(0.15)
+        await self._simulate_work(0.1)
         
-        await self._report_progress("signal_generation", 75.0, "Generating signals", progress_callback)
-        await asyncio.sleep(0.1)
+        # Trend identification and volume analysis don't depend on each other,
+        # so run them concurrently and only join for signal generation
+        trend, volume_confirmation = await asyncio.gather(
+            self._analyze_trends(request, progress_callback),
+            self._analyze_volume(request, progress_callback)
+        )
+        facts = await self._generate_signals(trend, volume_confirmation, progress_callback)
         
         await self._report_progress("completion", 100.0, "Analysis complete", progress_callback)
         
-        # Sample facts (in real implementation, these would come from actual analysis)
-        facts = {
-            "primary_trend": "bullish",
-            "secondary_trend": "neutral", 
-            "volume_confirmation": True,
-            "trend_strength": 0.65,
-            "analysis_note": "DEMO DATA - Not real Dow Theory analysis"
-        }
-        
         quality = self._create_quality_meta(
             sample_size=1000.0,
             freshness_sec=30.0,
@@ -109,6 +140,44 @@ class DowLegendEngine(TraditionalLegendBase):
             quality=quality
         )
 
+    async def _analyze_trends(
+        self,
+        request: LegendRequest,
+        progress_callback: Optional[ProgressCallback]
+    ) -> Dict[str, Any]:
+        """Identify primary/secondary trends and their strength (demo: sample values)."""
+        await self._report_progress("trend_analysis", 25.0, "Identifying primary trends", progress_callback)
+        await self._simulate_work(0.2)
+        return _DOW_SAMPLE_TREND.copy()
+
+    async def _analyze_volume(
+        self,
+        request: LegendRequest,
+        progress_callback: Optional[ProgressCallback]
+    ) -> bool:
+        """Check whether volume confirms the trend (demo: sample value)."""
+        await self._report_progress("volume_confirmation", 50.0, "Analyzing volume patterns", progress_callback)
+        await self._simulate_work(0.15)
+        return _DOW_SAMPLE_VOLUME_CONFIRMATION
+
+    async def _generate_signals(
+        self,
+        trend: Dict[str, Any],
+        volume_confirmation: bool,
+        progress_callback: Optional[ProgressCallback]
+    ) -> Dict[str, Any]:
+        """Combine the trend and volume findings into the envelope facts."""
+        await self._report_progress("signal_generation", 75.0, "Generating signals", progress_callback)
+        await self._simulate_work(0.1)
+        
+        return {
+            "primary_trend": trend["primary_trend"],
+            "secondary_trend": trend["secondary_trend"],
+            "volume_confirmation": volume_confirmation,
+            "trend_strength": trend["trend_strength"],
+            "analysis_note": _DOW_ANALYSIS_NOTE
+        }
+
     async def _report_progress(
         self,
         stage: str,
@@ -127,7 +196,7 @@ class DowLegendEngine(TraditionalLegendBase):
             await progress_callback(progress)
 
 
-class WyckoffLegendEngine(TraditionalLegendBase):
+class WyckoffLegendEngine(_SimulatedLatencyMixin, TraditionalLegendBase):
     """
     Enhanced Wyckoff Method engine implementing strict Wyckoff analysis.
     
@@ -172,19 +241,19 @@ class WyckoffLegendEngine(TraditionalLegendBase):
         """
         # Report progress stages
         await self._report_progress("initialization", 0.0, "Initializing Wyckoff analysis", progress_callback)
-        await asyncio.sleep(0.05)
+        await self._simulate_work(0.05)
         
         await self._report_progress("law_analysis", 20.0, "Analyzing Wyckoff Laws", progress_callback)
-        await asyncio.sleep(0.1)
+        await self._simulate_work(0.1)
         
         await self._report_progress("phase_detection", 40.0, "Detecting market phases", progress_callback)
-        await asyncio.sleep(0.12)
+        await self._simulate_work(0.12)
         
         await self._report_progress("event_analysis", 60.0, "Analyzing Wyckoff events", progress_callback)
-        await asyncio.sleep(0.15)
+        await self._simulate_work(0.15)
         
         await self._report_progress("smart_money", 80.0, "Evaluating smart money activity", progress_callback)
-        await asyncio.sleep(0.1)
+        await self._simulate_work(0.1)
         
         await self._report_progress("completion", 100.0, "Wyckoff analysis complete", progress_callback)
         
@@ -441,7 +510,7 @@ class WyckoffLegendEngine(TraditionalLegendBase):
             await progress_callback(progress)
 
 
-class VolumeBreakoutScanner(ScannerEngineBase):
+class VolumeBreakoutScanner(_SimulatedLatencyMixin, ScannerEngineBase):
     """
     Example scanner engine for volume breakout detection.
     
@@ -478,25 +547,19 @@ class VolumeBreakoutScanner(ScannerEngineBase):
         """
         # Report progress stages
         await self._report_progress("initialization", 0.0, "Initializing volume scanner", progress_callback)
-        await asyncio.sleep(0.05)
+        await self._simulate_work(0.05)
         
         await self._report_progress("volume_analysis", 40.0, "Analyzing volume patterns", progress_callback)
-        await asyncio.sleep(0.1)
+        await self._simulate_work(0.1)
         
         await self._report_progress("breakout_detection", 80.0, "Detecting breakout signals", progress_callback)
-        await asyncio.sleep(0.08)
+        await self._simulate_work(0.08)
         
         await self._report_progress("completion", 100.0, "Scan complete", progress_callback)
         
         # Sample facts (in real implementation, these would come from actual scanning)
-        facts = {
-            "volume_spike_detected": True,
-            "volume_ratio": 2.3,  # 2.3x normal volume
-            "breakout_direction": "upward",
-            "price_confirmation": True,
-            "scan_timestamp": datetime.now().isoformat(),
-            "analysis_note": "DEMO DATA - Not real volume scanning"
-        }
+        facts = _VOLUME_BREAKOUT_SAMPLE_FACTS.copy()
+        facts["scan_timestamp"] = datetime.now().isoformat()
         
         quality = self._create_quality_meta(
             sample_size=200.0,  # Smaller sample for recent data
@@ -8,11 +8,10 @@ awareness of Traditional Legends vs Scanner Engines.
 
 import asyncio
 from datetime import datetime
-from typing import List, Dict, Optional, Set, Any
+from functools import lru_cache
+from typing import List, Dict, Optional, Sequence, Set, Any, Tuple
 
-import pandas as pd
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Set, Any
 
 from .contracts import (
     ILegendEngine,
@@ -27,6 +26,30 @@ from .engines import DowLegendEngine, WyckoffLegendEngine, VolumeBreakoutScanner
 from .consensus import ConsensusAnalyzer, ConsensusResult
 
 
+# Ordering of reliability levels, lowest first
+_RELIABILITY_RANK = {
+    ReliabilityLevel.EXPERIMENTAL: 1,
+    ReliabilityLevel.VARIABLE: 2,
+    ReliabilityLevel.MEDIUM: 3,
+    ReliabilityLevel.HIGH: 4
+}
+
+# Upper bound on memoized quick_consensus(cache=True) results per Pantheon instance
+_QUICK_CONSENSUS_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=1)
+def _default_engines() -> Tuple[ILegendEngine, ...]:
+    """Build the default engine set once; create_default() registers these instances."""
+    return (
+        # Traditional Legends
+        DowLegendEngine(),
+        WyckoffLegendEngine(),
+        # Scanner Engine example
+        VolumeBreakoutScanner(),
+    )
+
+
 @dataclass
 class AnalysisResult:
     """
@@ -61,6 +84,11 @@ class Pantheon:
     def __init__(self):
         """Initialize Pantheon with an empty registry of legend engines."""
         self._engines: Dict[str, ILegendEngine] = {}
+        # Built on first access to available_engines, reset whenever the registry changes
+        self._available_engines: Optional[Dict[str, Dict[str, str]]] = None
+        # quick_consensus(cache=True) results keyed on (symbol, timeframe, as_of
+        # to the second, min_reliability); also reset whenever the registry changes
+        self._quick_consensus_cache: Dict[Tuple[Any, ...], 'asyncio.Future[ConsensusResult]'] = {}
         
     def register_engine(self, engine: ILegendEngine) -> None:
         """
@@ -76,18 +104,27 @@ class Pantheon:
             raise ValueError(f"Engine '{engine.name}' is already registered")
         
         self._engines[engine.name] = engine
+        self._available_engines = None
+        self._quick_consensus_cache.clear()
     
     @property
     def available_engines(self) -> Dict[str, Dict[str, str]]:
-        """Get available engines with their type classification."""
-        return {
-            engine.name: {
-                "type": engine.legend_type.value,
-                "reliability": engine.reliability_level.value,
-                "description": engine.description
+        """
+        Get available engines with their type classification.
+        
+        The mapping is cached until the next register/unregister call,
+        so treat it as read-only.
+        """
+        if self._available_engines is None:
+            self._available_engines = {
+                engine.name: {
+                    "type": engine.legend_type.value,
+                    "reliability": engine.reliability_level.value,
+                    "description": engine.description
+                }
+                for engine in self._engines.values()
             }
-            for engine in self._engines.values()
-        }
+        return self._available_engines
     
     def get_engines_by_type(self, legend_type: LegendType) -> List[ILegendEngine]:
         """Get engines filtered by legend type."""
@@ -96,16 +133,10 @@ class Pantheon:
     
     def get_engines_by_reliability(self, min_reliability: ReliabilityLevel) -> List[ILegendEngine]:
         """Get engines with at least the specified reliability level."""
-        reliability_order = [
-            ReliabilityLevel.EXPERIMENTAL, 
-            ReliabilityLevel.VARIABLE, 
-            ReliabilityLevel.MEDIUM, 
-            ReliabilityLevel.HIGH
-        ]
-        min_index = reliability_order.index(min_reliability)
+        min_rank = _RELIABILITY_RANK[min_reliability]
         
         return [engine for engine in self._engines.values() 
-                if reliability_order.index(engine.reliability_level) >= min_index]
+                if _RELIABILITY_RANK[engine.reliability_level] >= min_rank]
     
     def unregister_engine(self, name: str) -> None:
         """
@@ -121,6 +152,8 @@ class Pantheon:
             raise KeyError(f"No engine named '{name}' is registered")
         
         del self._engines[name]
+        self._available_engines = None
+        self._quick_consensus_cache.clear()
     
     def get_registered_engines(self) -> List[str]:
         """Get the names of all registered legend engines."""
@@ -216,15 +249,15 @@ class Pantheon:
         """
         Create a Pantheon instance with default legend engines registered.
         
+        Each call returns a new Pantheon with its own registry, but the
+        default engines are stateless and shared between instances.
+        
         Returns:
             Pantheon instance with traditional legend engines and a scanner example
         """
         pantheon = cls()
-        # Traditional Legends
-        pantheon.register_engine(DowLegendEngine())
-        pantheon.register_engine(WyckoffLegendEngine())
-        # Scanner Engine example
-        pantheon.register_engine(VolumeBreakoutScanner())
+        for engine in _default_engines():
+            pantheon.register_engine(engine)
         return pantheon
     
     async def analyze_with_consensus(
@@ -266,12 +299,8 @@ class Pantheon:
             
             # Calculate automatic consensus if enabled and multiple engines
             consensus = None
-            if enable_consensus and len(engine_results) > 1:
-                analyzer = ConsensusAnalyzer()
-                consensus = analyzer.analyze(
-                    engine_results,
-                    min_reliability=min_consensus_reliability
-                )
+            if enable_consensus:
+                consensus = self._build_consensus(engine_results, min_consensus_reliability)
             
             # Calculate execution time
             execution_time = (datetime.now() - start_time).total_seconds() * 1000
@@ -300,12 +329,66 @@ class Pantheon:
                 analyzed_at=start_time
             )
     
+    async def analyze_and_filter(
+        self,
+        request: LegendRequest,
+        reliability_levels: Sequence[Optional[ReliabilityLevel]] = (
+            ReliabilityLevel.HIGH,
+            ReliabilityLevel.MEDIUM
+        ),
+        engine_names: Optional[List[str]] = None,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[Optional[ReliabilityLevel], Optional[ConsensusResult]]:
+        """
+        Run engines once and build a consensus for each reliability filter.
+        
+        Equivalent to calling analyze_with_consensus() once per level, but the
+        engines only execute a single time and each filter is applied to the
+        same results.
+        
+        Args:
+            request: Analysis request with symbol, timeframe, etc.
+            reliability_levels: Minimum reliability for each consensus
+                (None = no filter)
+            engine_names: Specific engines to run (None = all engines)
+            progress_callback: Optional progress reporting
+            
+        Returns:
+            Mapping of each requested level to its consensus (None if fewer
+            than two engines produced results)
+            
+        Raises:
+            KeyError: If any specified engine is not registered
+        """
+        if engine_names is None:
+            engine_results = await self.run_all_legends_async(request, progress_callback)
+        else:
+            engine_results = await self.run_multiple_legends_async(
+                engine_names, request, progress_callback
+            )
+        
+        return {
+            level: self._build_consensus(engine_results, level)
+            for level in reliability_levels
+        }
+    
+    @staticmethod
+    def _build_consensus(
+        engine_results: List[LegendEnvelope],
+        min_reliability: Optional[ReliabilityLevel]
+    ) -> Optional[ConsensusResult]:
+        """Consensus over engine results, or None with fewer than two results."""
+        if len(engine_results) <= 1:
+            return None
+        return ConsensusAnalyzer().analyze(engine_results, min_reliability=min_reliability)
+    
     async def quick_consensus(
         self,
         symbol: str,
         timeframe: str = "1D",
         timestamp: Optional[datetime] = None,
-        min_reliability: Optional[ReliabilityLevel] = None
+        min_reliability: Optional[ReliabilityLevel] = None,
+        cache: bool = False
     ) -> ConsensusResult:
         """
         Quick consensus analysis for a symbol with minimal setup.
@@ -315,16 +398,55 @@ class Pantheon:
             timeframe: Analysis timeframe (e.g., "1D", "4H")
             timestamp: Analysis timestamp (defaults to now)
             min_reliability: Minimum engine reliability for consensus
+            cache: Share results between calls (off by default, so every
+                call runs the engines and returns its own result)
             
         Returns:
             ConsensusResult with automatic consensus analysis
+            
+        With cache=True, repeated calls for the same symbol, timeframe, second
+        and reliability filter share one engine run and return the same result
+        object, so treat it as read-only. Cancelling one caller leaves the
+        shared run going for the others. The memo is cleared whenever an
+        engine is registered or unregistered.
         """
         request = LegendRequest(
             symbol=symbol,
             timeframe=timeframe,
             as_of=timestamp or datetime.now()
         )
+        if not cache:
+            return await self._run_quick_consensus(request, min_reliability)
+        
+        key = (symbol, timeframe, request.as_of.replace(microsecond=0), min_reliability)
+        
+        cached = self._quick_consensus_cache.get(key)
+        if cached is not None and (cached.done() or cached.get_loop() is asyncio.get_running_loop()):
+            # Shielded, so cancelling one caller doesn't cancel the shared run
+            return await asyncio.shield(cached)
+        
+        if len(self._quick_consensus_cache) >= _QUICK_CONSENSUS_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            del self._quick_consensus_cache[next(iter(self._quick_consensus_cache))]
+        
+        future = asyncio.ensure_future(self._run_quick_consensus(request, min_reliability))
+        self._quick_consensus_cache[key] = future
+        
+        def evict_if_failed(done: 'asyncio.Future[ConsensusResult]') -> None:
+            # Don't keep failed or cancelled runs around for the next caller
+            if (done.cancelled() or done.exception() is not None) \
+                    and self._quick_consensus_cache.get(key) is done:
+                del self._quick_consensus_cache[key]
         
+        future.add_done_callback(evict_if_failed)
+        return await asyncio.shield(future)
+    
+    async def _run_quick_consensus(
+        self,
+        request: LegendRequest,
+        min_reliability: Optional[ReliabilityLevel]
+    ) -> ConsensusResult:
+        """Run the engines behind quick_consensus (uncached)."""
         result = await self.analyze_with_consensus(
             request=request,
             enable_consensus=True,
@@ -338,7 +460,7 @@ class Pantheon:
             analyzer = ConsensusAnalyzer()
             return analyzer._create_insufficient_data_result()
 
-    def get_consensus_analysis(self, symbol: str, data: pd.DataFrame, 
+    def get_consensus_analysis(self, symbol: str, data: Any, 
                              min_reliability: ReliabilityLevel = ReliabilityLevel.MEDIUM,
                              include_scanner_engines: bool = True) -> Dict[str, Any]:
         """
@@ -350,7 +472,8 @@ class Pantheon:
         
         Args:
             symbol: The symbol to analyze
-            data: Market data DataFrame
+            data: Market data, e.g. a mapping of column name to values
+                (a pandas DataFrame works too; the demo does not read it)
             min_reliability: Minimum reliability level to include
             include_scanner_engines: Whether to include scanner engines
             
@@ -359,17 +482,10 @@ class Pantheon:
         """
         # Get qualified engines
         qualified_engines = []
+        min_value = _RELIABILITY_RANK[min_reliability]
         for name, engine in self._engines.items():
             # Check reliability level
-            reliability_values = {
-                ReliabilityLevel.HIGH: 4,
-                ReliabilityLevel.MEDIUM: 3,
-                ReliabilityLevel.VARIABLE: 2,
-                ReliabilityLevel.EXPERIMENTAL: 1
-            }
-            
-            min_value = reliability_values[min_reliability]
-            engine_value = reliability_values[engine.reliability_level]
+            engine_value = _RELIABILITY_RANK[engine.reliability_level]
             
             if engine_value < min_value:
                 continue
@@ -442,6 +558,30 @@ class Pantheon:
 
 
 # Convenience functions for common use cases
+@lru_cache(maxsize=1)
+def get_default_pantheon() -> Pantheon:
+    """
+    Get a shared Pantheon with the default engines registered.
+    
+    The instance is built on first call and reused afterwards, so repeated
+    callers skip engine registration. Its quick_consensus(cache=True) memo is
+    shared too, so equal cached requests return the same result object.
+    Callers that register or unregister engines on it should use
+    Pantheon.create_default() instead, or call clear_default_pantheon_cache()
+    to get a fresh instance. quick_analysis() and consensus_only() build
+    their own Pantheon and don't share results.
+    
+    Returns:
+        The process-wide default Pantheon instance
+    """
+    return Pantheon.create_default()
+
+
+def clear_default_pantheon_cache() -> None:
+    """Drop the shared default Pantheon so the next call builds a new one."""
+    get_default_pantheon.cache_clear()
+
+
 async def quick_analysis(
     symbol: str,
     timeframe: str = "1D",
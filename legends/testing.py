@@ -0,0 +1,152 @@
+"""
+Helpers for running Pantheon Legends test and example scripts.
+
+run() is a drop-in for asyncio.run() that keeps one event loop per process
+instead of creating and closing a new loop (and selector) on every call.
+
+run_buffered() and task_local_stdout() let scripts run independent test or
+example coroutines concurrently and still print each one's output in order.
+"""
+
+import asyncio
+import atexit
+import contextlib
+import contextvars
+import io
+import sys
+from typing import Any, Awaitable, Callable, Iterator, Optional, TextIO, TypeVar
+
+T = TypeVar("T")
+
+# Shared loop, created on first use and closed at interpreter exit
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Output buffer of the run_buffered() call in the current task (None = write through)
+_task_output: "contextvars.ContextVar[Optional[io.StringIO]]" = contextvars.ContextVar(
+    "task_output", default=None
+)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def _cancel_leftover_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel tasks the coroutine left running, as asyncio.run() does."""
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def run(main: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion on the shared event loop.
+
+    Args:
+        main: Coroutine (or other awaitable) to run
+
+    Returns:
+        Whatever the awaitable returns
+
+    Raises:
+        RuntimeError: If called while an event loop is already running
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("legends.testing.run() cannot be called from a running event loop")
+
+    loop = _get_loop()
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        _cancel_leftover_tasks(loop)
+
+
+class _TaskLocalStdout:
+    """stdout proxy that routes writes into the current task's buffer."""
+    
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+    
+    def write(self, text: str) -> int:
+        return (_task_output.get() or self._stream).write(text)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+@contextlib.contextmanager
+def task_local_stdout() -> Iterator[None]:
+    """
+    Route sys.stdout into the buffer of whichever run_buffered() call is
+    writing; writes from anywhere else go straight to the real stdout.
+    """
+    stdout = sys.stdout
+    sys.stdout = _TaskLocalStdout(stdout)  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        sys.stdout = stdout
+
+
+async def run_buffered(func: Callable[..., Awaitable[Any]], *args: Any,
+                       limit: Optional[asyncio.Semaphore] = None,
+                       return_exception: bool = False) -> Any:
+    """
+    Run func(*args) with its printed output captured.
+    
+    Use inside task_local_stdout(), one call per gather() argument: gather()
+    runs each call in its own context, so concurrent calls don't interleave.
+    
+    Args:
+        func: Coroutine function to run
+        *args: Arguments passed to func
+        limit: Optional semaphore held while func runs
+        return_exception: Return (output, exception or None) instead of
+            letting an exception from func propagate
+    
+    Returns:
+        The captured output, or (output, exception or None) if return_exception
+    """
+    buffer = io.StringIO()
+    token = _task_output.set(buffer)
+    try:
+        async with limit or contextlib.AsyncExitStack():
+            await func(*args)
+    except Exception as e:
+        if not return_exception:
+            raise
+        return buffer.getvalue(), e
+    finally:
+        # Awaited directly (not via gather), this shares the caller's context
+        _task_output.reset(token)
+    if return_exception:
+        return buffer.getvalue(), None
+    return buffer.getvalue()
+
+
+@atexit.register
+def close() -> None:
+    """Shut down and close the shared event loop (runs automatically at exit)."""
+    global _loop
+    loop, _loop = _loop, None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+__all__ = ["run", "run_buffered", "task_local_stdout", "close"]
@@ -2,9 +2,12 @@
 """Quick test of the enhanced Wyckoff engine"""
 
 import json
+from pathlib import Path
 from legends import WyckoffLegendEngine
 from datetime import datetime
 
+TEST_DATA_DIR = Path('wyckoff_test_data')
+
 def main():
     # Test engine loading
     engine = WyckoffLegendEngine()
@@ -14,10 +17,9 @@ def main():
     
     # Test with sample data
     try:
-        with open('wyckoff_test_data/accumulation_bars.json') as f:
-            bars_data = json.load(f)
-        with open('wyckoff_test_data/accumulation_events.json') as f:
-            events_data = json.load(f)
+        # json.loads takes the raw bytes directly, skipping the text wrapper
+        bars_data = json.loads((TEST_DATA_DIR / 'accumulation_bars.json').read_bytes())
+        events_data = json.loads((TEST_DATA_DIR / 'accumulation_events.json').read_bytes())
         
         print("✅ Test Data Loaded:")
         print(f"   Bars: {len(bars_data)}")
@@ -5,11 +5,11 @@ import legends
 from legends import LegendType, ReliabilityLevel
 
 print('✅ Testing Enhanced Type System')
-print('Legend Types:', [t.value for t in LegendType])
-print('Reliability Levels:', [r.value for r in ReliabilityLevel])
+print('Legend Types:', list(legends.LEGEND_TYPE_VALUES))
+print('Reliability Levels:', list(legends.RELIABILITY_VALUES))
 
 print('\n✅ Creating Pantheon')
-pantheon = legends.Pantheon.create_default()
+pantheon = legends.get_default_pantheon()
 
 print('\n✅ Available Engines:')
 for name, info in pantheon.available_engines.items():
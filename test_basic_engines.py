@@ -5,13 +5,13 @@ Simple test to check engine execution
 
 import asyncio
 from datetime import datetime
-from legends import Pantheon, LegendRequest
+from legends import get_default_pantheon, LegendRequest, testing
 
 
 async def test_basic_engines():
     print("Testing basic engine execution...")
     
-    pantheon = Pantheon.create_default()
+    pantheon = get_default_pantheon()
     request = LegendRequest(
         symbol="TEST",
         timeframe="1D", 
@@ -20,15 +20,19 @@ async def test_basic_engines():
     
     print(f"Registered engines: {list(pantheon._engines.keys())}")
     
-    # Test individual engines
-    for engine_name in pantheon._engines.keys():
-        try:
-            result = await pantheon.run_legend_async(engine_name, request)
-            print(f"✅ {engine_name}: {bool(result.facts)} facts")
-            if result.facts:
-                print(f"   Sample facts: {list(result.facts.keys())[:3]}")
-        except Exception as e:
-            print(f"❌ {engine_name}: {e}")
+    # Test individual engines (concurrently; failures come back as exceptions)
+    engine_names = list(pantheon._engines.keys())
+    outcomes = await asyncio.gather(
+        *(pantheon.run_legend_async(name, request) for name in engine_names),
+        return_exceptions=True
+    )
+    for engine_name, outcome in zip(engine_names, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {engine_name}: {outcome}")
+            continue
+        print(f"✅ {engine_name}: {bool(outcome.facts)} facts")
+        if outcome.facts:
+            print(f"   Sample facts: {list(outcome.facts.keys())[:3]}")
     
     # Test all engines together
     print(f"\nTesting all engines together...")
@@ -40,4 +44,4 @@ async def test_basic_engines():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_basic_engines())
+    testing.run(test_basic_engines())
@@ -3,7 +3,6 @@
 Test consensus analysis functionality.
 """
 
-import pandas as pd
 from datetime import datetime
 import legends
 
@@ -11,16 +10,16 @@ def test_consensus_analysis():
     print('=== Testing Consensus Analysis ===')
     
     # Create pantheon with all engines
-    pantheon = legends.Pantheon.create_default()
+    pantheon = legends.get_default_pantheon()
     
-    # Create sample data (would normally be real market data)
-    data = pd.DataFrame({
+    # Create sample data as plain columns (would normally be real market data)
+    data = {
         'open': [100, 101, 102, 103, 104],
         'high': [101, 102, 103, 104, 105], 
         'low': [99, 100, 101, 102, 103],
         'close': [100.5, 101.5, 102.5, 103.5, 104.5],
         'volume': [1000, 1200, 800, 1500, 900]
-    })
+    }
     
     try:
         # Test consensus analysis
@@ -2,8 +2,7 @@
 Quick test to verify the consolidated Wyckoff engine works with existing examples.
 """
 
-import asyncio
-from legends import WyckoffLegendEngine, LegendRequest
+from legends import WyckoffLegendEngine, LegendRequest, testing
 from datetime import datetime
 
 async def test_consolidated_wyckoff():
@@ -48,4 +47,4 @@ async def test_consolidated_wyckoff():
     print(f"\n✅ Consolidated Wyckoff engine working perfectly!")
     
 if __name__ == "__main__":
-    asyncio.run(test_consolidated_wyckoff())
+    testing.run(test_consolidated_wyckoff())
@@ -18,7 +18,7 @@ def test_deployment():
     from legends import LegendType, ReliabilityLevel, TraditionalLegendBase, ScannerEngineBase
 
     # Create pantheon
-    pantheon = legends.Pantheon.create_default()
+    pantheon = legends.get_default_pantheon()
     engines = pantheon.available_engines
 
     print(f'✅ Enhanced type system working')
@@ -38,12 +38,10 @@ def test_deployment():
 
     # Test consensus analysis
     print('\n=== Consensus Analysis Test ===')
-    import pandas as pd
-    
-    sample_data = pd.DataFrame({
+    sample_data = {
         'close': [100, 101, 102, 103, 104],
         'volume': [1000, 1100, 1200, 1300, 1400]
-    })
+    }
     
     consensus = pantheon.get_consensus_analysis("TEST", sample_data)
     print(f'📊 Consensus calculated: {consensus["qualified_engines"]} engines')
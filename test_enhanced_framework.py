@@ -4,8 +4,13 @@ Test script for the enhanced Pantheon Legends framework.
 Tests the new type system and filtering capabilities.
 """
 
+from operator import attrgetter
+
 import legends
 
+# Pulls (type, reliability, description) off an engine in one call
+_ENGINE_DETAILS = attrgetter('legend_type.value', 'reliability_level.value', 'description')
+
 def test_enhanced_framework():
     print('=== Testing Enhanced Pantheon Legends Framework ===')
     
@@ -14,7 +19,7 @@ def test_enhanced_framework():
     print('✅ Type system imports successful')
     
     # Create pantheon with all engines
-    pantheon = legends.Pantheon.create_default()
+    pantheon = legends.get_default_pantheon()
     print('✅ Pantheon created with default engines')
     
     # Test type-aware methods
@@ -37,11 +42,11 @@ def test_enhanced_framework():
     
     # Test engine properties
     print('\n🔍 Engine Details:')
-    for name, engine in pantheon._engines.items():
-        print(f'  {name}:')
-        print(f'    Type: {engine.legend_type.value}')
-        print(f'    Reliability: {engine.reliability_level.value}')
-        print(f'    Description: {engine.description}')
+    rows = [(name, *_ENGINE_DETAILS(engine)) for name, engine in pantheon._engines.items()]
+    print('\n'.join(
+        f'  {name}:\n    Type: {legend_type}\n    Reliability: {reliability}\n    Description: {description}'
+        for name, legend_type, reliability, description in rows
+    ))
     
     print('\n🎉 All tests passed!')
     return True
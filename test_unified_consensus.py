@@ -4,24 +4,39 @@ Test the new unified consensus analysis functionality
 """
 
 import asyncio
+import sys
 from datetime import datetime
 import legends
+from legends import testing
 
 
-async def test_unified_consensus():
+# One timestamp and one (frozen, hashable) request per symbol shared by every test
+_NOW = datetime.now()
+_REQUESTS = {
+    ("TEST", "1D"): legends.LegendRequest(symbol="TEST", timeframe="1D", as_of=_NOW),
+    ("BTCUSD", "4H"): legends.LegendRequest(symbol="BTCUSD", timeframe="4H", as_of=_NOW),
+    ("TSLA", "1H"): legends.LegendRequest(symbol="TSLA", timeframe="1H", as_of=_NOW),
+}
+
+# Fact keys an engine may report its headline signal under, in priority order
+_SIGNAL_KEYS = ('signal', 'position_bias', 'primary_trend')
+
+# Upper bound on sub-tests (and so engine runs) in flight at once
+_MAX_CONCURRENT_TESTS = 4
+
+def _pantheon_or_default(pantheon):
+    """The Pantheon main() passes in, or the shared default when a test runs on its own."""
+    return pantheon if pantheon is not None else legends.get_default_pantheon()
+
+
+async def test_unified_consensus(pantheon=None):
     """Test the new analyze_with_consensus method"""
+    pantheon = _pantheon_or_default(pantheon)
     print("🧪 Testing Unified Consensus Analysis")
     print("=" * 45)
     
-    # Create pantheon with default engines
-    pantheon = legends.Pantheon.create_default()
-    
-    # Create analysis request
-    request = legends.LegendRequest(
-        symbol="TEST",
-        timeframe="1D",
-        as_of=datetime.now()
-    )
+    # Shared analysis request
+    request = _REQUESTS[("TEST", "1D")]
     
     print(f"Available engines: {list(pantheon._engines.keys())}")
     
@@ -40,9 +55,8 @@ async def test_unified_consensus():
     # Display individual engine results
     print(f"\n🔧 Individual Engine Results:")
     for engine_result in result.engine_results:
-        signal = engine_result.facts.get('signal', 
-                 engine_result.facts.get('position_bias',
-                 engine_result.facts.get('primary_trend', 'N/A')))
+        facts = engine_result.facts
+        signal = next((facts[key] for key in _SIGNAL_KEYS if key in facts), 'N/A')
         print(f"  • {engine_result.legend}: {signal}")
     
     # Display consensus result
@@ -68,18 +82,19 @@ async def test_unified_consensus():
     return result
 
 
-async def test_quick_consensus():
+async def test_quick_consensus(pantheon=None):
     """Test the quick_consensus convenience method"""
+    pantheon = _pantheon_or_default(pantheon)
     print("\n\n⚡ Testing Quick Consensus Method")
     print("=" * 40)
     
-    pantheon = legends.Pantheon.create_default()
-    
     # Test quick consensus
     print("🏃 Running quick consensus for SPY...")
     consensus = await pantheon.quick_consensus(
         symbol="SPY",
-        timeframe="1D"
+        timeframe="1D",
+        timestamp=_NOW,
+        cache=True  # shares its engine run with test_consensus_signals
     )
     
     print(f"Signal: {consensus.signal.value}")
@@ -88,57 +103,94 @@ async def test_quick_consensus():
     print(f"Quality: {consensus.consensus_quality}")
 
 
-async def test_filtered_consensus():
+async def test_quick_consensus_cancellation():
+    """Test that cancelling one quick_consensus caller doesn't cancel the others"""
+    print("\n\n🛑 Testing Quick Consensus Cancellation")
+    print("=" * 40)
+    
+    # Own Pantheon with slow engines, so the shared run is still pending at cancel time
+    pantheon = legends.Pantheon()
+    pantheon.register_engine(legends.DowLegendEngine(simulate_latency=True))
+    pantheon.register_engine(legends.WyckoffLegendEngine(simulate_latency=True))
+    
+    first = asyncio.ensure_future(pantheon.quick_consensus("SPY", timestamp=_NOW, cache=True))
+    second = asyncio.ensure_future(pantheon.quick_consensus("SPY", timestamp=_NOW, cache=True))
+    await asyncio.sleep(0)
+    first.cancel()
+    
+    consensus = await second
+    assert first.cancelled()
+    assert consensus.engines_analyzed == 2, consensus.engines_analyzed
+    print(f"Cancelled first caller; second still got: {consensus.signal.value}")
+    
+    # The completed run stays memoized for later callers
+    assert await pantheon.quick_consensus("SPY", timestamp=_NOW, cache=True) is consensus
+    print("Completed run is reused after the cancellation")
+
+
+async def test_quick_consensus_cache():
+    """Test that quick_consensus only shares results when asked to"""
+    print("\n\n🗃️ Testing Quick Consensus Caching")
+    print("=" * 40)
+    
+    pantheon = legends.Pantheon.create_default()
+    
+    # Uncached by default: every call gets its own result
+    first = await pantheon.quick_consensus("SPY", timestamp=_NOW)
+    second = await pantheon.quick_consensus("SPY", timestamp=_NOW)
+    assert first is not second
+    print("Default calls return separate results")
+    
+    cached = await pantheon.quick_consensus("SPY", timestamp=_NOW, cache=True)
+    assert await pantheon.quick_consensus("SPY", timestamp=_NOW, cache=True) is cached
+    print("cache=True calls share one result")
+    
+    # Changing the registry drops the memo
+    pantheon.unregister_engine("Dow Theory")
+    refreshed = await pantheon.quick_consensus("SPY", timestamp=_NOW, cache=True)
+    assert refreshed is not cached
+    assert "Dow Theory" not in refreshed.engine_contributions
+    print("Unregistering an engine clears the memo")
+
+
+async def test_filtered_consensus(pantheon=None):
     """Test consensus with reliability filtering"""
+    pantheon = _pantheon_or_default(pantheon)
     print("\n\n🔍 Testing Filtered Consensus")
     print("=" * 35)
     
-    pantheon = legends.Pantheon.create_default()
-    request = legends.LegendRequest(
-        symbol="BTCUSD",
-        timeframe="4H",
-        as_of=datetime.now()
-    )
+    request = _REQUESTS[("BTCUSD", "4H")]
     
-    # Test with high reliability filter
-    print("🏆 Running with HIGH reliability filter...")
-    result = await pantheon.analyze_with_consensus(
-        request=request,
-        enable_consensus=True,
-        min_consensus_reliability=legends.ReliabilityLevel.HIGH
-    )
+    # Run the engines once and build both filtered consensus views from the same results
+    print("🔁 Running engines once for HIGH and MEDIUM reliability filters...")
+    high, medium = legends.ReliabilityLevel.HIGH, legends.ReliabilityLevel.MEDIUM
+    consensus_by_level = await pantheon.analyze_and_filter(request, [high, medium])
     
-    if result.consensus:
-        print(f"High-reliability consensus: {result.consensus.signal.value}")
-        print(f"Engines used: {result.consensus.engines_analyzed}")
-        print(f"Average reliability: {result.consensus.reliability_average:.2f}")
+    # High reliability filter
+    print("\n🏆 HIGH reliability filter:")
+    consensus = consensus_by_level[high]
+    if consensus:
+        print(f"High-reliability consensus: {consensus.signal.value}")
+        print(f"Engines used: {consensus.engines_analyzed}")
+        print(f"Average reliability: {consensus.reliability_average:.2f}")
     else:
         print("No high-reliability engines available")
     
-    # Test with medium reliability filter
-    print("\n📊 Running with MEDIUM reliability filter...")
-    result = await pantheon.analyze_with_consensus(
-        request=request,
-        enable_consensus=True,
-        min_consensus_reliability=legends.ReliabilityLevel.MEDIUM
-    )
-    
-    if result.consensus:
-        print(f"Medium-reliability consensus: {result.consensus.signal.value}")
-        print(f"Engines used: {result.consensus.engines_analyzed}")
+    # Medium reliability filter
+    print("\n📊 MEDIUM reliability filter:")
+    consensus = consensus_by_level[medium]
+    if consensus:
+        print(f"Medium-reliability consensus: {consensus.signal.value}")
+        print(f"Engines used: {consensus.engines_analyzed}")
 
 
-async def test_selective_engines():
+async def test_selective_engines(pantheon=None):
     """Test consensus with specific engines"""
+    pantheon = _pantheon_or_default(pantheon)
     print("\n\n🎛️ Testing Selective Engine Consensus")
     print("=" * 40)
     
-    pantheon = legends.Pantheon.create_default()
-    request = legends.LegendRequest(
-        symbol="TSLA",
-        timeframe="1H", 
-        as_of=datetime.now()
-    )
+    request = _REQUESTS[("TSLA", "1H")]
     
     # Test with only traditional engines
     traditional_engines = ["Dow Theory", "Wyckoff Method"]
@@ -157,8 +209,9 @@ async def test_selective_engines():
     print(f"Engines run: {len(result.engine_results)}")
 
 
-async def test_consensus_signals():
+async def test_consensus_signals(pantheon=None):
     """Test different consensus signal types"""
+    pantheon = _pantheon_or_default(pantheon)
     print("\n\n📡 Testing Consensus Signal Types") 
     print("=" * 40)
     
@@ -168,8 +221,7 @@ async def test_consensus_signals():
         print(f"  • {signal.value}")
     
     # Test with real analysis
-    pantheon = legends.Pantheon.create_default()
-    consensus = await pantheon.quick_consensus("SPY")
+    consensus = await pantheon.quick_consensus("SPY", timestamp=_NOW, cache=True)
     
     print(f"\nSPY current signal: {consensus.signal.value}")
     print(f"Signal interpretation:")
@@ -193,11 +245,23 @@ async def main():
     print("=" * 60)
     
     try:
-        await test_unified_consensus()
-        await test_quick_consensus()
-        await test_filtered_consensus() 
-        await test_selective_engines()
-        await test_consensus_signals()
+        # Tests are independent, so run them concurrently (bounded) and print in order
+        pantheon = legends.get_default_pantheon()
+        buffered = dict(limit=asyncio.Semaphore(_MAX_CONCURRENT_TESTS), return_exception=True)
+        with testing.task_local_stdout():
+            outcomes = await asyncio.gather(
+                testing.run_buffered(test_unified_consensus, pantheon, **buffered),
+                testing.run_buffered(test_quick_consensus, pantheon, **buffered),
+                testing.run_buffered(test_quick_consensus_cancellation, **buffered),
+                testing.run_buffered(test_quick_consensus_cache, **buffered),
+                testing.run_buffered(test_filtered_consensus, pantheon, **buffered),
+                testing.run_buffered(test_selective_engines, pantheon, **buffered),
+                testing.run_buffered(test_consensus_signals, pantheon, **buffered),
+            )
+        for output, error in outcomes:
+            sys.stdout.write(output)
+            if error is not None:
+                raise error
         
         print("\n\n✅ All unified consensus tests completed!")
         print("🎉 Automatic consensus analysis is working!")
@@ -206,6 +270,8 @@ async def main():
         print("  ✅ Automatic consensus from real engine results")
         print("  ✅ Reliability-weighted scoring")
         print("  ✅ Quick consensus convenience method")
+        print("  ✅ Cancelling one quick consensus caller")
+        print("  ✅ Opt-in quick consensus caching")
         print("  ✅ Selective engine filtering")
         print("  ✅ No manual orchestration required")
         
@@ -216,4 +282,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    testing.run(main())
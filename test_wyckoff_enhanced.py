@@ -6,9 +6,94 @@ the comprehensive analysis capabilities including the three Wyckoff Laws,
 market phase detection, event analysis, and smart money activity.
 """
 
-import asyncio
+import sys
+from dataclasses import asdict
 from datetime import datetime
-from legends import WyckoffLegendEngine, LegendRequest, LegendProgress
+from legends import WyckoffLegendEngine, LegendRequest, LegendProgress, testing
+
+# Analysis report, formatted against result.facts plus the pre-rendered
+# event and zone listings
+_REPORT_TEMPLATE = """
+{rule}
+ENHANCED WYCKOFF ANALYSIS RESULTS
+{rule}
+
+🔍 WYCKOFF FUNDAMENTAL LAWS:
+
+  📊 Law of Supply & Demand:
+    Market Balance: {law_of_supply_demand[market_balance]}
+    Supply Pressure: {law_of_supply_demand[supply_pressure]:.2f}
+    Demand Strength: {law_of_supply_demand[demand_strength]:.2f}
+    Validation: {law_of_supply_demand[law_validation]}
+
+  🎯 Law of Cause & Effect:
+    Accumulation Period: {law_of_cause_effect[accumulation_period]}
+    Cause Magnitude: {law_of_cause_effect[cause_magnitude]:.2f}
+    Expected Effect: {law_of_cause_effect[expected_effect]}
+    Price Objective: ${law_of_cause_effect[price_objective]:.2f}
+    Validation: {law_of_cause_effect[law_validation]}
+
+  ⚡ Law of Effort & Result:
+    Effort Level: {law_of_effort_result[effort_level]:.2f}
+    Result Achieved: {law_of_effort_result[result_achieved]:.2f}
+    Harmony: {law_of_effort_result[effort_result_harmony]}
+    Divergence: {law_of_effort_result[divergence_type]}
+    Validation: {law_of_effort_result[law_validation]}
+
+📈 MARKET PHASE ANALYSIS:
+    Current Phase: {current_phase}
+    Confidence: {phase_confidence:.2f}
+    Progression: {phase_progression:.2f}
+
+🎪 WYCKOFF EVENTS DETECTED:
+{event_lines}
+💰 SMART MONEY ANALYSIS:
+    Activity Level: {smart_money_activity:.2f}
+    Composite Man Behavior: {composite_man_behavior[behavior]}
+    Behavior Confidence: {composite_man_behavior[confidence]:.2f}
+
+📊 VOLUME SPREAD ANALYSIS:
+    Volume Quality: {volume_spread_analysis[volume_quality]}
+    Spread Analysis: {volume_spread_analysis[spread_analysis]}
+    Relationship Health: {volume_spread_analysis[relationship_health]}
+
+💡 TRADING GUIDANCE:
+    Position Bias: {position_bias}
+    Risk/Reward Ratio: {risk_reward_assessment[risk_reward_ratio]:.1f}
+    Success Probability: {risk_reward_assessment[probability_success]:.2f}
+    Entry Strategy: {entry_exit_guidance[entry_strategy]}
+    Entry Zone: ${entry_exit_guidance[optimal_entry_zone][low]:.2f} - ${entry_exit_guidance[optimal_entry_zone][high]:.2f}
+    Stop Loss: ${entry_exit_guidance[stop_loss_level]:.2f}
+
+🔴 SUPPLY ZONES:
+{supply_zone_lines}
+🟢 DEMAND ZONES:
+{demand_zone_lines}"""
+
+_ZONE_LINE = "    ${level:.2f} (Strength: {strength:.2f})\n"
+
+# Quality metadata, formatted against asdict(result.quality)
+_QUALITY_TEMPLATE = """
+📋 ANALYSIS QUALITY:
+    Sample Size: {sample_size}
+    Freshness: {freshness_sec}s
+    Data Completeness: {data_completeness:.2f}
+    Validation Years: {validation_period_years}
+    False Positive Risk: {false_positive_risk:.2f}
+    Manipulation Sensitivity: {manipulation_sensitivity:.2f}
+"""
+
+def _write_block(text):
+    """Write a large block to stdout as a single pre-encoded write."""
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        # Replaced stdout (e.g. captured output) without a binary layer
+        stream.write(text)
+        return
+    stream.flush()  # keep earlier print() output ahead of the raw bytes
+    buffer.write(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+    buffer.flush()
 
 async def progress_callback(progress: LegendProgress):
     """Progress callback to monitor analysis stages."""
@@ -38,96 +123,22 @@ async def test_wyckoff_enhanced():
     # Run the analysis
     result = await engine.run_async(request, progress_callback)
     
-    print("\n" + "=" * 60)
-    print("ENHANCED WYCKOFF ANALYSIS RESULTS")
-    print("=" * 60)
-    
-    # Display fundamental laws
-    print("\n🔍 WYCKOFF FUNDAMENTAL LAWS:")
     laws = result.facts
-    
-    print(f"\n  📊 Law of Supply & Demand:")
-    supply_demand = laws["law_of_supply_demand"]
-    print(f"    Market Balance: {supply_demand['market_balance']}")
-    print(f"    Supply Pressure: {supply_demand['supply_pressure']:.2f}")
-    print(f"    Demand Strength: {supply_demand['demand_strength']:.2f}")
-    print(f"    Validation: {supply_demand['law_validation']}")
-    
-    print(f"\n  🎯 Law of Cause & Effect:")
-    cause_effect = laws["law_of_cause_effect"]
-    print(f"    Accumulation Period: {cause_effect['accumulation_period']}")
-    print(f"    Cause Magnitude: {cause_effect['cause_magnitude']:.2f}")
-    print(f"    Expected Effect: {cause_effect['expected_effect']}")
-    print(f"    Price Objective: ${cause_effect['price_objective']:.2f}")
-    print(f"    Validation: {cause_effect['law_validation']}")
-    
-    print(f"\n  ⚡ Law of Effort & Result:")
-    effort_result = laws["law_of_effort_result"]
-    print(f"    Effort Level: {effort_result['effort_level']:.2f}")
-    print(f"    Result Achieved: {effort_result['result_achieved']:.2f}")
-    print(f"    Harmony: {effort_result['effort_result_harmony']}")
-    print(f"    Divergence: {effort_result['divergence_type']}")
-    print(f"    Validation: {effort_result['law_validation']}")
-    
-    # Display market phase
-    print(f"\n📈 MARKET PHASE ANALYSIS:")
-    print(f"    Current Phase: {laws['current_phase']}")
-    print(f"    Confidence: {laws['phase_confidence']:.2f}")
-    print(f"    Progression: {laws['phase_progression']:.2f}")
-    
-    # Display Wyckoff events
-    print(f"\n🎪 WYCKOFF EVENTS DETECTED:")
-    events = laws["detected_events"]
+    significant_events = set(laws["significant_events"])
     confidence_scores = laws["event_confidence_scores"]
-    for event in events:
-        confidence = confidence_scores.get(event, 0.0)
-        star = "⭐" if event in laws["significant_events"] else "  "
-        print(f"    {star} {event}: {confidence:.2f}")
-    
-    # Display smart money analysis
-    print(f"\n💰 SMART MONEY ANALYSIS:")
-    smart_money = laws["smart_money_activity"]
-    composite_man = laws["composite_man_behavior"]
-    print(f"    Activity Level: {smart_money:.2f}")
-    print(f"    Composite Man Behavior: {composite_man['behavior']}")
-    print(f"    Behavior Confidence: {composite_man['confidence']:.2f}")
-    
-    # Display volume spread analysis
-    print(f"\n📊 VOLUME SPREAD ANALYSIS:")
-    vs_analysis = laws["volume_spread_analysis"]
-    print(f"    Volume Quality: {vs_analysis['volume_quality']}")
-    print(f"    Spread Analysis: {vs_analysis['spread_analysis']}")
-    print(f"    Relationship Health: {vs_analysis['relationship_health']}")
-    
-    # Display trading guidance
-    print(f"\n💡 TRADING GUIDANCE:")
-    risk_reward = laws["risk_reward_assessment"]
-    entry_exit = laws["entry_exit_guidance"]
-    print(f"    Position Bias: {laws['position_bias']}")
-    print(f"    Risk/Reward Ratio: {risk_reward['risk_reward_ratio']:.1f}")
-    print(f"    Success Probability: {risk_reward['probability_success']:.2f}")
-    print(f"    Entry Strategy: {entry_exit['entry_strategy']}")
-    print(f"    Entry Zone: ${entry_exit['optimal_entry_zone']['low']:.2f} - ${entry_exit['optimal_entry_zone']['high']:.2f}")
-    print(f"    Stop Loss: ${entry_exit['stop_loss_level']:.2f}")
-    
-    # Display supply/demand zones
-    print(f"\n🔴 SUPPLY ZONES:")
-    for zone in laws["supply_zones"]:
-        print(f"    ${zone['level']:.2f} (Strength: {zone['strength']:.2f})")
-    
-    print(f"\n🟢 DEMAND ZONES:")
-    for zone in laws["demand_zones"]:
-        print(f"    ${zone['level']:.2f} (Strength: {zone['strength']:.2f})")
-    
-    # Display quality metadata
-    print(f"\n📋 ANALYSIS QUALITY:")
-    quality = result.quality
-    print(f"    Sample Size: {quality.sample_size}")
-    print(f"    Freshness: {quality.freshness_sec}s")
-    print(f"    Data Completeness: {quality.data_completeness:.2f}")
-    print(f"    Validation Years: {quality.validation_period_years}")
-    print(f"    False Positive Risk: {quality.false_positive_risk:.2f}")
-    print(f"    Manipulation Sensitivity: {quality.manipulation_sensitivity:.2f}")
+    report = _REPORT_TEMPLATE.format_map(dict(
+        laws,
+        rule="=" * 60,
+        event_lines="".join(
+            f"    {'⭐' if event in significant_events else '  '} {event}: "
+            f"{confidence_scores.get(event, 0.0):.2f}\n"
+            for event in laws["detected_events"]
+        ),
+        supply_zone_lines="".join(map(_ZONE_LINE.format_map, laws["supply_zones"])),
+        demand_zone_lines="".join(map(_ZONE_LINE.format_map, laws["demand_zones"])),
+    ))
+    quality = _QUALITY_TEMPLATE.format_map(asdict(result.quality))
+    _write_block(report + quality)
     
     print(f"\n✅ Enhanced Wyckoff analysis completed successfully!")
     print(f"    Legend: {result.legend}")
@@ -184,4 +195,4 @@ if __name__ == "__main__":
         await test_wyckoff_enhanced()
         await test_contract_compatibility()
     
-    asyncio.run(main())
+    testing.run(main())
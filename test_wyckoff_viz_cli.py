@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test that the Wyckoff visualizer loads any JSON number a bars file holds.
+"""
+
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from wyckoff_viz_cli import bars_to_columns, load_bar_columns, visualize_bars
+
+# One fractional volume and one that doesn't fit in 32 bits
+BARS = [
+    {"open": 100.0, "high": 101.5, "low": 99.25, "close": 101.0, "volume": 1500.5},
+    {"open": 101.0, "high": 102.0, "low": 100.5, "close": 100.75, "volume": 2 ** 40},
+]
+
+
+def test_wide_volumes():
+    print('=== Testing Visualizer Volume Columns ===')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bars_path = Path(tmp) / "wide_bars.json"
+        bars_path.write_text(json.dumps(BARS))
+        loaded = load_bar_columns(str(bars_path))
+
+    converted = bars_to_columns(BARS)
+    assert list(loaded.volume) == [1500.5, 2 ** 40], loaded.volume
+    assert list(converted.volume) == list(loaded.volume)
+    assert list(loaded.close) == [101.0, 100.75], loaded.close
+    print(f"✅ Loaded volumes: {list(loaded.volume)}")
+
+    out = io.StringIO()
+    visualize_bars(loaded, {"1": "SOS"}, "Wide Volumes", out)
+    assert "1,099,511,627,776" in out.getvalue()
+    print("✅ Visualized bars with fractional and >32-bit volumes")
+
+    print("\n🎉 Visualizer volume tests passed!")
+
+
+def test_sub_cent_prices():
+    print('=== Testing Visualizer Sub-Cent Prices ===')
+
+    # Spread of 0.0002 would round to zero cents
+    bars = [{"open": 0.0012, "high": 0.0013, "low": 0.0011, "close": 0.0012, "volume": 500}]
+    columns = bars_to_columns(bars)
+    assert list(columns.high) == [0.0013], columns.high
+
+    out = io.StringIO()
+    visualize_bars(columns, {"0": "SC"}, "Sub-Cent", out)
+    assert "Close@50.0%" in out.getvalue(), out.getvalue()
+    print("✅ Visualized an SC bar with a sub-cent spread")
+
+
+if __name__ == '__main__':
+    test_wide_volumes()
+    test_sub_cent_prices()
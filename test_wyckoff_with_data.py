@@ -9,7 +9,28 @@ import asyncio
 import json
 import pathlib
 from datetime import datetime
-from legends import WyckoffLegendEngine, LegendRequest
+from legends import WyckoffLegendEngine, LegendRequest, testing
+
+# Expected fixture schemas
+BAR_KEYS = frozenset({"time", "open", "high", "low", "close", "volume"})
+PF_KEYS = frozenset({"direction", "breakout_level", "boxes", "box_size", "objective"})
+
+# Wyckoff event labels the fixtures may use
+VALID_LABELS = frozenset({
+    "SC", "AR", "ST", "Spring", "Test", "SOS", "LPS", "BC", "UT", "UTAD", "SOW", "LPSY"
+})
+
+async def load_json_async(path: pathlib.Path):
+    """Read a JSON file on the default executor so several loads can overlap."""
+    loop = asyncio.get_running_loop()
+    return json.loads(await loop.run_in_executor(None, path.read_bytes))
+
+def load_pattern_files(test_data_dir: pathlib.Path, pattern: str):
+    """Start loading <pattern>_bars/_events/_pf.json concurrently."""
+    return asyncio.gather(*(
+        load_json_async(test_data_dir / f"{pattern}_{kind}.json")
+        for kind in ("bars", "events", "pf")
+    ))
 
 async def test_wyckoff_with_test_data():
     """Test Wyckoff engine with deterministic test data."""
@@ -23,39 +44,46 @@ async def test_wyckoff_with_test_data():
         print("❌ Test data directory not found. Run generate_wyckoff_test_data.py first.")
         return
     
+    # Start both patterns' loads; distribution keeps loading during the accumulation run
+    acc_loading = load_pattern_files(test_data_dir, "accumulation")
+    dist_loading = load_pattern_files(test_data_dir, "distribution")
+    
+    # One shared Wyckoff engine runs both analyses concurrently, alongside the loads
+    # (engine will use same analysis but different symbol for distribution)
+    wyckoff = WyckoffLegendEngine()
+    now = datetime.now()  # both requests share one as_of
+    acc_request = LegendRequest(
+        symbol="TEST_ACC",
+        timeframe="1D",
+        as_of=now
+    )
+    dist_request = LegendRequest(
+        symbol="TEST_DIST",
+        timeframe="1D",
+        as_of=now
+    )
+    analyses = asyncio.gather(wyckoff.run_async(acc_request), wyckoff.run_async(dist_request))
+    
     # Test accumulation data
     print("\n📈 TESTING ACCUMULATION PATTERN")
     print("-" * 40)
     
-    with open(test_data_dir / "accumulation_bars.json") as f:
-        acc_bars = json.load(f)
-    with open(test_data_dir / "accumulation_events.json") as f:
-        acc_events = json.load(f)
-    with open(test_data_dir / "accumulation_pf.json") as f:
-        acc_pf = json.load(f)
+    acc_bars, acc_events, acc_pf = await acc_loading
     
     print(f"📊 Loaded {len(acc_bars)} bars with {len(acc_events)} events")
     print(f"🎯 Expected P&F objective: {acc_pf['objective']} (direction: {acc_pf['direction']})")
     
-    # Create Wyckoff engine and analyze
-    wyckoff = WyckoffLegendEngine()
-    request = LegendRequest(
-        symbol="TEST_ACC",
-        timeframe="1D",
-        as_of=datetime.now()
-    )
-    
-    result = await wyckoff.run_async(request)
+    acc_result, dist_result = await analyses
     
     # Analyze results
     print(f"\n🔍 WYCKOFF ANALYSIS RESULTS:")
-    print(f"   Current Phase: {result.facts['current_phase']}")
-    print(f"   Position Bias: {result.facts['position_bias']}")
-    print(f"   Smart Money Activity: {result.facts['smart_money_activity']}")
+    print(f"   Current Phase: {acc_result.facts['current_phase']}")
+    print(f"   Position Bias: {acc_result.facts['position_bias']}")
+    print(f"   Smart Money Activity: {acc_result.facts['smart_money_activity']}")
     
     # Check if analysis aligns with test data
-    phase = result.facts['current_phase']
-    bias = result.facts['position_bias']
+    phase = acc_result.facts['current_phase']
+    bias = acc_result.facts['position_bias']
     
     # Accumulation should show bullish bias and accumulation phase
     if "Accumulation" in phase and "bullish" in bias:
@@ -64,7 +92,7 @@ async def test_wyckoff_with_test_data():
         print(f"   ⚠️  Analysis may not match expected accumulation pattern")
     
     # Check supply/demand law
-    supply_demand = result.facts['law_of_supply_demand']
+    supply_demand = acc_result.facts['law_of_supply_demand']
     print(f"   Supply/Demand Balance: {supply_demand['market_balance']}")
     if supply_demand['market_balance'] == 'demand_favored':
         print("   ✅ Correctly identifies demand-favored market")
@@ -73,91 +101,77 @@ async def test_wyckoff_with_test_data():
     print("\n📉 TESTING DISTRIBUTION PATTERN")
     print("-" * 40)
     
-    with open(test_data_dir / "distribution_bars.json") as f:
-        dist_bars = json.load(f)
-    with open(test_data_dir / "distribution_events.json") as f:
-        dist_events = json.load(f)
-    with open(test_data_dir / "distribution_pf.json") as f:
-        dist_pf = json.load(f)
+    dist_bars, dist_events, dist_pf = await dist_loading
     
     print(f"📊 Loaded {len(dist_bars)} bars with {len(dist_events)} events")
     print(f"🎯 Expected P&F objective: {dist_pf['objective']} (direction: {dist_pf['direction']})")
     
-    # Test with distribution data (engine will use same analysis but different symbol)
-    request = LegendRequest(
-        symbol="TEST_DIST",
-        timeframe="1D",
-        as_of=datetime.now()
-    )
-    
-    result = await wyckoff.run_async(request)
-    
     print(f"\n🔍 WYCKOFF ANALYSIS RESULTS:")
-    print(f"   Current Phase: {result.facts['current_phase']}")
-    print(f"   Position Bias: {result.facts['position_bias']}")
-    print(f"   Smart Money Activity: {result.facts['smart_money_activity']}")
+    print(f"   Current Phase: {dist_result.facts['current_phase']}")
+    print(f"   Position Bias: {dist_result.facts['position_bias']}")
+    print(f"   Smart Money Activity: {dist_result.facts['smart_money_activity']}")
     
     # Test data validation
     print(f"\n🧮 TEST DATA VALIDATION")
     print("-" * 30)
     
     # Validate accumulation data structure
-    acc_bar_keys = set(acc_bars[0].keys())
-    expected_keys = {"time", "open", "high", "low", "close", "volume"}
-    if acc_bar_keys == expected_keys:
+    acc_bar_keys = acc_bars[0].keys()
+    if acc_bar_keys == BAR_KEYS:
         print("✅ Accumulation bars have correct schema")
     else:
-        print(f"❌ Accumulation bars missing keys: {expected_keys - acc_bar_keys}")
+        print(f"❌ Accumulation bars missing keys: {set(BAR_KEYS - acc_bar_keys)}")
     
     # Validate events structure
-    acc_event_labels = set(acc_events.values())
-    valid_labels = {"SC", "AR", "ST", "Spring", "Test", "SOS", "LPS", "BC", "UT", "UTAD", "SOW", "LPSY"}
-    if acc_event_labels.issubset(valid_labels):
+    invalid_labels = [label for label in acc_events.values() if label not in VALID_LABELS]
+    if not invalid_labels:
         print("✅ Accumulation events use valid Wyckoff labels")
     else:
-        print(f"❌ Invalid event labels: {acc_event_labels - valid_labels}")
+        print(f"❌ Invalid event labels: {set(invalid_labels)}")
     
     # Validate P&F structure
-    acc_pf_keys = set(acc_pf.keys())
-    expected_pf_keys = {"direction", "breakout_level", "boxes", "box_size", "objective"}
-    if acc_pf_keys == expected_pf_keys:
+    acc_pf_keys = acc_pf.keys()
+    if acc_pf_keys == PF_KEYS:
         print("✅ P&F data has correct schema")
     else:
-        print(f"❌ P&F data missing keys: {expected_pf_keys - acc_pf_keys}")
+        print(f"❌ P&F data missing keys: {set(PF_KEYS - acc_pf_keys)}")
     
     # Validate Wyckoff relationships in accumulation data
     print(f"\n🔬 WYCKOFF CANON VALIDATION")
     print("-" * 35)
     
-    # Find key bars by events
-    sc_idx = int([k for k, v in acc_events.items() if v == "SC"][0])
-    ar_idx = int([k for k, v in acc_events.items() if v == "AR"][0])
-    st_idx = int([k for k, v in acc_events.items() if v == "ST"][0])
-    sos_idx = int([k for k, v in acc_events.items() if v == "SOS"][0])
+    # Find key bars by events (one pass; first bar wins for repeated labels)
+    idx_by_label = {}
+    for k, v in acc_events.items():
+        idx_by_label.setdefault(v, int(k))
+    sc_idx = idx_by_label["SC"]
+    ar_idx = idx_by_label["AR"]
+    st_idx = idx_by_label["ST"]
+    sos_idx = idx_by_label["SOS"]
     
-    sc_bar = acc_bars[sc_idx]
-    ar_bar = acc_bars[ar_idx]
-    st_bar = acc_bars[st_idx]
-    sos_bar = acc_bars[sos_idx]
+    # Read the checked fields column-wise
+    highs = [bar["high"] for bar in acc_bars]
+    lows = [bar["low"] for bar in acc_bars]
+    volumes = [bar["volume"] for bar in acc_bars]
     
     # Validate SC: climactic volume, wide spread
-    sc_spread = sc_bar["high"] - sc_bar["low"]
-    print(f"SC Bar: Volume={sc_bar['volume']}, Spread={sc_spread:.1f}")
+    sc_spread = highs[sc_idx] - lows[sc_idx]
+    print(f"SC Bar: Volume={volumes[sc_idx]}, Spread={sc_spread:.1f}")
     
     # Validate ST: lower volume than SC
-    if st_bar["volume"] < sc_bar["volume"]:
+    if volumes[st_idx] < volumes[sc_idx]:
         print("✅ ST has lower volume than SC")
     else:
-        print(f"❌ ST volume ({st_bar['volume']}) not lower than SC ({sc_bar['volume']})")
+        print(f"❌ ST volume ({volumes[st_idx]}) not lower than SC ({volumes[sc_idx]})")
     
     # Validate SOS: breaks AR high
-    if sos_bar["high"] > ar_bar["high"]:
+    if highs[sos_idx] > highs[ar_idx]:
         print("✅ SOS breaks through AR high")
     else:
-        print(f"❌ SOS high ({sos_bar['high']}) doesn't break AR high ({ar_bar['high']})")
+        print(f"❌ SOS high ({highs[sos_idx]}) doesn't break AR high ({highs[ar_idx]})")
     
     print(f"\n✅ Test completed! Enhanced Wyckoff engine analyzed deterministic test data.")
     print(f"📁 Test data available in: {test_data_dir.absolute()}")
 
 if __name__ == "__main__":
-    asyncio.run(test_wyckoff_with_test_data())
+    testing.run(test_wyckoff_with_test_data())
@@ -5,136 +5,279 @@ This script provides a text-based visualization of the generated test data
 to help validate the Wyckoff patterns and events.
 """
 
+import io
 import json
 import argparse
 import pathlib
-from typing import Dict, List, Any
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+
+# One visualize_bars table row: bar#, event, open, high, low, close, volume,
+# spread, notes (bound once so the format spec is parsed a single time)
+_ROW_FMT = "{:3d}  | {:6} | {:6.1f} | {:6.1f} | {:6.1f} | {:6.1f} | {:8,} | {:6.1f} | {}\n".format
+
+# Bar characteristic bits, and the notes text for every combination of them
+_HIGH_VOLUME = 1
+_WIDE_SPREAD = 2
+_RED = 4
+_BAR_NOTES = tuple(
+    ", ".join(
+        (["High Vol"] if code & _HIGH_VOLUME else [])
+        + (["Wide Spread"] if code & _WIDE_SPREAD else [])
+        + ["Red" if code & _RED else "Green"]
+    )
+    for code in range(8)
+)
+
+
+class BarColumns(NamedTuple):
+    """
+    OHLCV bars stored column-wise (one sequence per field).
+    
+    Prices are float arrays, exactly as stored in the bars file. Volume is a
+    64-bit integer array when every value fits; a column holding fractional
+    or out-of-range volumes stays a plain list, so any JSON number the bars
+    file holds is accepted.
+    """
+    open: "array[float]"
+    high: "array[float]"
+    low: "array[float]"
+    close: "array[float]"
+    volume: Sequence[Any]
+
+
+def _volume_column(values: List[Any]) -> Sequence[Any]:
+    """Pack volumes into an array('q'), or keep the list if any value doesn't fit."""
+    try:
+        return array('q', values)
+    except (TypeError, OverflowError):
+        return values
+
+
+def bars_to_columns(bars: List[Dict[str, Any]]) -> BarColumns:
+    """Convert a list of bar dicts (as stored in *_bars.json) to columns."""
+    def prices(field: str) -> "array[float]":
+        return array('d', [bar[field] for bar in bars])
+    
+    return BarColumns(
+        open=prices("open"),
+        high=prices("high"),
+        low=prices("low"),
+        close=prices("close"),
+        volume=_volume_column([bar["volume"] for bar in bars]),
+    )
+
+
+def _file_cache_key(filepath: str) -> Tuple[str, int, int]:
+    """(resolved path, mtime_ns, size): equal for every spelling of an unchanged file."""
+    path = pathlib.Path(filepath).resolve()
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=64)
+def _load_json_cached(filepath: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; mtime_ns and size only key the cache."""
+    # json.loads accepts the raw bytes, so skip the text-mode decode layer
+    return json.loads(pathlib.Path(filepath).read_bytes())
 
 
 def load_json_file(filepath: str) -> Any:
-    """Load data from JSON file."""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    """
+    Load data from JSON file.
+    
+    Parsed data is cached until the file's mtime or size changes, so
+    callers must treat the result as read-only.
+    """
+    return _load_json_cached(*_file_cache_key(filepath))
 
 
-def visualize_bars(bars: List[Dict], events: Dict[str, str], title: str) -> None:
-    """Create a text-based visualization of OHLCV bars with events."""
-    print(f"\n{title}")
-    print("=" * len(title))
+@lru_cache(maxsize=64)
+def _load_bar_columns_cached(filepath: str, mtime_ns: int, size: int) -> BarColumns:
+    """Decode a bars file into columns; mtime_ns and size only key the cache."""
+    columns = BarColumns(array('d'), array('d'), array('d'), array('d'), [])
+    add_open, add_high, add_low, add_close = (column.append for column in columns[:4])
+    volumes = columns.volume
     
-    # Find price range for scaling
-    all_prices = []
-    for bar in bars:
-        all_prices.extend([bar["high"], bar["low"], bar["open"], bar["close"]])
+    def take_bar(bar: Dict[str, Any]) -> None:
+        # Called as each bar object is decoded; returning None drops the dict
+        add_open(bar["open"])
+        add_high(bar["high"])
+        add_low(bar["low"])
+        add_close(bar["close"])
+        volumes.append(bar["volume"])
+    
+    json.loads(pathlib.Path(filepath).read_bytes(), object_hook=take_bar)
+    # Pack volume like bars_to_columns, so both loaders accept the same files
+    return columns._replace(volume=_volume_column(volumes))
+
+
+def load_bar_columns(filepath: str) -> BarColumns:
+    """
+    Load a *_bars.json file directly into BarColumns.
+    
+    Each bar's fields are copied out as the decoder produces the bar, so
+    the list of bar dicts is never kept. The file is still read and decoded
+    in one go; this is not a streaming parser. Cached like load_json_file.
+    """
+    return _load_bar_columns_cached(*_file_cache_key(filepath))
+
+
+def visualize_bars(bars: BarColumns, events: Dict[str, str], title: str,
+                   out: Optional[TextIO] = None) -> None:
+    """Create a text-based visualization of OHLCV bars with events (on out, default stdout)."""
+    if out is None:
+        out = sys.stdout
+    print(f"\n{title}", file=out)
+    print("=" * len(title), file=out)
+    
+    # Derive per-bar values column-wise
+    opens, highs, lows, closes, volumes = bars
+    spreads = [high - low for high, low in zip(highs, lows)]
+    note_codes = [
+        (_HIGH_VOLUME if vol > 120000 else 0)
+        | (_WIDE_SPREAD if spread > 8 else 0)
+        | (_RED if close < open_ else 0)
+        for open_, close, vol, spread in zip(opens, closes, volumes, spreads)
+    ]
     
-    min_price = min(all_prices)
-    max_price = max(all_prices)
+    # Find price range for scaling
+    min_price = min(min(highs), min(lows), min(opens), min(closes))
+    max_price = max(max(highs), max(lows), max(opens), max(closes))
     price_range = max_price - min_price
     
-    print(f"Price Range: ${min_price:.1f} - ${max_price:.1f}")
-    print(f"Volume Range: {min(b['volume'] for b in bars):,} - {max(b['volume'] for b in bars):,}")
-    print()
+    print(f"Price Range: ${min_price:.1f} - ${max_price:.1f}", file=out)
+    print(f"Volume Range: {min(volumes):,} - {max(volumes):,}", file=out)
+    print(file=out)
     
     # Header
-    print("Bar# | Event | Open   | High   | Low    | Close  | Volume   | Spread | Notes")
-    print("-" * 80)
+    print("Bar# | Event | Open   | High   | Low    | Close  | Volume   | Spread | Notes", file=out)
+    print("-" * 80, file=out)
+    
+    # Event label per bar position ("" = no event); events past the last bar are ignored
+    event_at = [""] * len(closes)
+    for idx, label in events.items():
+        position = int(idx)
+        if 0 <= position < len(event_at):
+            event_at[position] = label
     
-    for i, bar in enumerate(bars):
+    rows = io.StringIO()
+    for i in range(len(closes)):
         bar_num = i + 1
-        event = events.get(str(i), "")
+        event = event_at[i]
+        spread = spreads[i]
+        vol = volumes[i]
         
-        # Calculate spread and volume characteristics
-        spread = bar["high"] - bar["low"]
-        vol = bar["volume"]
-        
-        # Determine bar characteristics
-        notes = []
-        if vol > 120000:
-            notes.append("High Vol")
-        if spread > 8:
-            notes.append("Wide Spread")
-        if bar["close"] < bar["open"]:
-            notes.append("Red")
-        else:
-            notes.append("Green")
+        # Bar characteristics
+        notes = _BAR_NOTES[note_codes[i]]
         
         # Special event analysis
         if event == "SC":
-            close_pos = (bar["close"] - bar["low"]) / spread
-            notes.append(f"Close@{close_pos:.1%}")
+            close_pos = (closes[i] - lows[i]) / spread
+            notes += f", Close@{close_pos:.1%}"
         elif event == "SOS":
-            notes.append("Breakout")
+            notes += ", Breakout"
         elif event == "Spring":
-            notes.append("Undercut")
-        
-        event_str = f"{event:6}" if event else "      "
-        notes_str = ", ".join(notes)
+            notes += ", Undercut"
         
-        print(f"{bar_num:3d}  | {event_str} | {bar['open']:6.1f} | {bar['high']:6.1f} | "
-              f"{bar['low']:6.1f} | {bar['close']:6.1f} | {vol:8,} | {spread:6.1f} | {notes_str}")
+        rows.write(_ROW_FMT(bar_num, event, opens[i], highs[i], lows[i], closes[i],
+                            vol, spread, notes))
+    
+    # One write for the whole table instead of a print() per bar
+    out.write(rows.getvalue())
 
 
-def visualize_pf(pf: Dict, title: str) -> None:
-    """Visualize Point & Figure objective."""
-    print(f"\n{title} - Point & Figure Analysis")
-    print("-" * 40)
-    print(f"Direction: {pf['direction'].upper()}")
-    print(f"Breakout Level: ${pf['breakout_level']:.1f}")
-    print(f"Horizontal Count: {pf['boxes']} boxes")
-    print(f"Box Size: ${pf['box_size']:.1f}")
-    print(f"Price Objective: ${pf['objective']:.1f}")
+def visualize_pf(pf: Dict, title: str, out: Optional[TextIO] = None) -> None:
+    """Visualize Point & Figure objective (on out, default stdout)."""
+    if out is None:
+        out = sys.stdout
+    print(f"\n{title} - Point & Figure Analysis", file=out)
+    print("-" * 40, file=out)
+    print(f"Direction: {pf['direction'].upper()}", file=out)
+    print(f"Breakout Level: ${pf['breakout_level']:.1f}", file=out)
+    print(f"Horizontal Count: {pf['boxes']} boxes", file=out)
+    print(f"Box Size: ${pf['box_size']:.1f}", file=out)
+    print(f"Price Objective: ${pf['objective']:.1f}", file=out)
     
     move_size = pf['objective'] - pf['breakout_level']
-    print(f"Expected Move: ${abs(move_size):.1f} ({'+' if move_size > 0 else ''}{move_size:.1f})")
+    print(f"Expected Move: ${abs(move_size):.1f} ({'+' if move_size > 0 else ''}{move_size:.1f})", file=out)
+
+
+def _climax_test_ratios(highs: Sequence[float], lows: Sequence[float],
+                        volumes: Sequence[Any], climax_idx: int,
+                        test_idx: int) -> Tuple[float, float, float, float]:
+    """
+    Compare a secondary test bar against its climax bar.
+    
+    Returns:
+        (climax spread, test spread,
+        test/climax volume ratio, test/climax spread ratio)
+    """
+    climax_spread = highs[climax_idx] - lows[climax_idx]
+    test_spread = highs[test_idx] - lows[test_idx]
+    return (
+        climax_spread,
+        test_spread,
+        volumes[test_idx] / volumes[climax_idx],
+        test_spread / climax_spread,
+    )
 
 
-def analyze_wyckoff_sequence(bars: List[Dict], events: Dict[str, str], sequence_type: str) -> None:
-    """Analyze the Wyckoff sequence for canonical relationships."""
-    print(f"\n{sequence_type.title()} Sequence Analysis")
-    print("-" * 35)
+def analyze_wyckoff_sequence(bars: BarColumns, events: Dict[str, str], sequence_type: str,
+                             out: Optional[TextIO] = None) -> None:
+    """Analyze the Wyckoff sequence for canonical relationships (on out, default stdout)."""
+    if out is None:
+        out = sys.stdout
+    print(f"\n{sequence_type.title()} Sequence Analysis", file=out)
+    print("-" * 35, file=out)
     
-    # Find key events
-    event_bars = {event: bars[int(idx)] for idx, event in events.items()}
+    # Find key events (label -> bar index)
+    event_idx = {event: int(idx) for idx, event in events.items()}
+    highs, lows, volumes = bars.high, bars.low, bars.volume
     
     if sequence_type == "accumulation":
         # Accumulation analysis
-        if "SC" in event_bars and "ST" in event_bars:
-            sc = event_bars["SC"]
-            st = event_bars["ST"]
-            sc_spread = sc["high"] - sc["low"]
-            st_spread = st["high"] - st["low"]
+        if "SC" in event_idx and "ST" in event_idx:
+            sc, st = event_idx["SC"], event_idx["ST"]
+            sc_spread, st_spread, volume_ratio, spread_ratio = _climax_test_ratios(
+                highs, lows, volumes, sc, st
+            )
             
-            print(f"SC Spread: {sc_spread:.1f}, Volume: {sc['volume']:,}")
-            print(f"ST Spread: {st_spread:.1f}, Volume: {st['volume']:,}")
-            print(f"ST/SC Volume Ratio: {st['volume']/sc['volume']:.2f}")
-            print(f"ST/SC Spread Ratio: {st_spread/sc_spread:.2f}")
+            print(f"SC Spread: {sc_spread:.1f}, Volume: {volumes[sc]:,}", file=out)
+            print(f"ST Spread: {st_spread:.1f}, Volume: {volumes[st]:,}", file=out)
+            print(f"ST/SC Volume Ratio: {volume_ratio:.2f}", file=out)
+            print(f"ST/SC Spread Ratio: {spread_ratio:.2f}", file=out)
         
-        if "AR" in event_bars and "SOS" in event_bars:
-            ar = event_bars["AR"]
-            sos = event_bars["SOS"]
-            print(f"AR High: ${ar['high']:.1f}")
-            print(f"SOS High: ${sos['high']:.1f}")
-            print(f"SOS breaks AR: {sos['high'] > ar['high']}")
+        if "AR" in event_idx and "SOS" in event_idx:
+            ar_high = highs[event_idx["AR"]]
+            sos_high = highs[event_idx["SOS"]]
+            print(f"AR High: ${ar_high:.1f}", file=out)
+            print(f"SOS High: ${sos_high:.1f}", file=out)
+            print(f"SOS breaks AR: {sos_high > ar_high}", file=out)
     
     elif sequence_type == "distribution":
         # Distribution analysis
-        if "BC" in event_bars and "ST" in event_bars:
-            bc = event_bars["BC"]
-            st = event_bars["ST"]
-            bc_spread = bc["high"] - bc["low"]
-            st_spread = st["high"] - st["low"]
+        if "BC" in event_idx and "ST" in event_idx:
+            bc, st = event_idx["BC"], event_idx["ST"]
+            bc_spread, st_spread, volume_ratio, spread_ratio = _climax_test_ratios(
+                highs, lows, volumes, bc, st
+            )
             
-            print(f"BC Spread: {bc_spread:.1f}, Volume: {bc['volume']:,}")
-            print(f"ST Spread: {st_spread:.1f}, Volume: {st['volume']:,}")
-            print(f"ST/BC Volume Ratio: {st['volume']/bc['volume']:.2f}")
-            print(f"ST/BC Spread Ratio: {st_spread/bc_spread:.2f}")
+            print(f"BC Spread: {bc_spread:.1f}, Volume: {volumes[bc]:,}", file=out)
+            print(f"ST Spread: {st_spread:.1f}, Volume: {volumes[st]:,}", file=out)
+            print(f"ST/BC Volume Ratio: {volume_ratio:.2f}", file=out)
+            print(f"ST/BC Spread Ratio: {spread_ratio:.2f}", file=out)
         
-        if "AR" in event_bars and "SOW" in event_bars:
-            ar = event_bars["AR"]
-            sow = event_bars["SOW"]
-            print(f"AR Low: ${ar['low']:.1f}")
-            print(f"SOW Low: ${sow['low']:.1f}")
-            print(f"SOW breaks AR: {sow['low'] < ar['low']}")
+        if "AR" in event_idx and "SOW" in event_idx:
+            ar_low = lows[event_idx["AR"]]
+            sow_low = lows[event_idx["SOW"]]
+            print(f"AR Low: ${ar_low:.1f}", file=out)
+            print(f"SOW Low: ${sow_low:.1f}", file=out)
+            print(f"SOW breaks AR: {sow_low < ar_low}", file=out)
 
 
 def main():
@@ -147,21 +290,29 @@ def main():
     
     args = parser.parse_args()
     
-    # Load data
-    bars = load_json_file(args.bars)
+    # Load data; bars are decoded straight into columns
+    bars = load_bar_columns(args.bars)
     events = load_json_file(args.ann)
     pf = load_json_file(args.pf)
     
     # Determine sequence type
     sequence_type = "accumulation" if "accumulation" in args.bars else "distribution"
     
-    # Visualize
-    visualize_bars(bars, events, args.title)
-    visualize_pf(pf, args.title)
-    analyze_wyckoff_sequence(bars, events, sequence_type)
+    # Visualize: the three views only read their inputs, so render them in
+    # parallel into separate buffers and print those in order
+    sections = [io.StringIO() for _ in range(3)]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(visualize_bars, bars, events, args.title, sections[0]),
+            pool.submit(visualize_pf, pf, args.title, sections[1]),
+            pool.submit(analyze_wyckoff_sequence, bars, events, sequence_type, sections[2]),
+        ]
+    for future in futures:
+        future.result()  # re-raise the first failure, if any
+    sys.stdout.writelines(section.getvalue() for section in sections)
     
     print(f"\n{'='*60}")
-    print(f"✅ Visualization complete for {len(bars)} bars with {len(events)} events")
+    print(f"✅ Visualization complete for {len(bars.close)} bars with {len(events)} events")
 
 
 if __name__ == "__main__":